@@ -6,31 +6,78 @@ Correlating Automated MT Metrics vs Human Evaluations (MQM TQS & Survey Preferen
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import stats
+from scipy.special import betainc
 from scipy.stats import pearsonr, spearmanr, kendalltau
+import argparse
+import io
 import os
 import warnings
 warnings.filterwarnings('ignore')
 
+# Multi-threaded PyArrow CSV parser when available; pandas' C parser otherwise
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+parser = argparse.ArgumentParser(description="Correlate automated MT metrics with MQM TQS and survey preferences")
+parser.add_argument('--no-charts', action='store_true',
+                    help='Write only the reports; matplotlib is not loaded')
+args = parser.parse_args()
+
+# Charts are written unless --no-charts is given; matplotlib is only imported
+# (and its font cache loaded) when the first chart is drawn
+MAKE_CHARTS = not args.no_charts
+
 # Create output directories
-os.makedirs('charts', exist_ok=True)
+if MAKE_CHARTS:
+    os.makedirs('charts', exist_ok=True)
 os.makedirs('reports', exist_ok=True)
 
-# Set plotting style
-plt.rcParams.update({
-    'font.family': 'DejaVu Sans',
-    'font.size': 11,
-    'axes.labelsize': 12,
-    'axes.titlesize': 14,
-    'axes.spines.top': False,
-    'axes.spines.right': False,
-    'figure.dpi': 150,
-    'figure.facecolor': 'white',
-    'axes.facecolor': 'white',
-    'axes.grid': True,
-    'grid.alpha': 0.3
-})
+plt = None
+Line2D = None
+
+def setup_matplotlib():
+    """Import matplotlib on first use: Agg backend, plotting style"""
+    global plt, Line2D
+    if plt is not None:
+        return
+    import matplotlib
+    matplotlib.use('Agg')  # charts are only written to disk; skip GUI backend setup
+    import matplotlib.pyplot as pyplot
+    from matplotlib.lines import Line2D as line2d
+    
+    # Set plotting style
+    pyplot.rcParams.update({
+        'font.family': 'DejaVu Sans',
+        'font.size': 11,
+        'axes.labelsize': 12,
+        'axes.titlesize': 14,
+        'axes.spines.top': False,
+        'axes.spines.right': False,
+        'figure.dpi': 150,
+        'savefig.dpi': 150,
+        'figure.facecolor': 'white',
+        'axes.facecolor': 'white',
+        'axes.grid': True,
+        'grid.alpha': 0.3
+    })
+    plt, Line2D = pyplot, line2d
+
+# Significance stars: p < 0.001 → ***, < 0.01 → **, < 0.05 → *, otherwise (or NaN) none
+_STAR_THRESH = np.array([0.001, 0.01, 0.05])
+_STAR_LABEL = np.array(['***', '**', '*', ''])
+
+def stars(p):
+    """Significance stars for a p-value, or an array of them for an array of p-values"""
+    return _STAR_LABEL[np.searchsorted(_STAR_THRESH, np.asarray(p), side='right')]
+
+def format_coefficients(values, p_values, decimals, star_width=0):
+    """Signed coefficients with significance stars (padded to star_width), 'N/A' where missing"""
+    values = pd.Series(values, dtype=np.float64).reset_index(drop=True)
+    labels = pd.Series(stars(np.asarray(p_values, dtype=np.float64))).str.ljust(star_width)
+    return (values.map(f'{{:+.{decimals}f}}'.format) + labels).where(values.notna(), 'N/A')
 
 print("=" * 80)
 print("METRICS CORRELATION ANALYSIS")
@@ -43,6 +90,17 @@ print("=" * 80)
 
 print("\n[1] Loading data sources...")
 
+# Narrow the key columns once after load: chunk ids to the smallest integer type,
+# text/model labels to categoricals. Scores stay float64 so reported statistics
+# are unaffected.
+def shrink_keys(df):
+    if 'chunk' in df:
+        df['chunk'] = pd.to_numeric(df['chunk'], downcast='integer')
+    for col in ('text', 'model'):
+        if col in df:
+            df[col] = df[col].astype('category')
+    return df
+
 # Helper to find data file (prefer symlinks in data_sources/, fallback to originals)
 def find_data_file(symlink_name, original_path):
     symlink_path = f'data_sources/{symlink_name}'
@@ -57,25 +115,23 @@ def find_data_file(symlink_name, original_path):
 mt_comp_path = find_data_file('mt_metrics_comp.csv', '../mt_eval/output/reports/on_comp_scores.csv')
 mt_mix_path = find_data_file('mt_metrics_mixtures.csv', '../mt_eval/output/reports/on_mixtures_scores.csv')
 
-mt_comp = pd.read_csv(mt_comp_path)
+mt_comp = pd.read_csv(mt_comp_path, engine=CSV_ENGINE)
 mt_comp['text'] = 'Comp'
-mt_mix = pd.read_csv(mt_mix_path)
+mt_mix = pd.read_csv(mt_mix_path, engine=CSV_ENGINE)
 mt_mix['text'] = 'Mixtures'
 mt_metrics = pd.concat([mt_comp, mt_mix], ignore_index=True)
-mt_metrics = mt_metrics.rename(columns={'chunk_id': 'chunk'})
+mt_metrics = shrink_keys(mt_metrics.rename(columns={'chunk_id': 'chunk'}))
 
 print(f"   MT Metrics: {len(mt_metrics)} rows")
 print(f"   Metrics available: {[c for c in mt_metrics.columns if c not in ['chunk', 'model', 'text']]}")
 
-# Load MQM data
+# Load MQM data (only the columns used below; the error-category breakdown is skipped at parse time).
+# The summary sheets are small and their header sits below skiprows, which the
+# pyarrow engine doesn't resolve for usecols, so they always use the C parser.
+MQM_COLUMNS = ['Text', 'Chunk', 'Model', 'APT', 'TQS']
+
 def load_mqm(filepath):
-    df = pd.read_csv(filepath, skiprows=2)
-    df.columns = ['blank', 'Text', 'Chunk', 'Translation', 'Model', 'Word Count', 'APT', 'TQS',
-                  'Neutral', 'Minor', 'Major', 'Critical', 
-                  'Term_Accuracy', 'Term_Consistency', 'Term_Total',
-                  'Acc_Mistranslation', 'Acc_Overtranslation', 'Acc_Undertranslation', 
-                  'Acc_Addition', 'Acc_Omission', 'Acc_Total']
-    df = df.drop('blank', axis=1)
+    df = pd.read_csv(filepath, skiprows=2, usecols=MQM_COLUMNS, engine='c')
     df = df.dropna(subset=['Text', 'Chunk', 'Model'])
     df['Chunk'] = df['Chunk'].astype(int)
     return df
@@ -86,13 +142,14 @@ mqm_mix_path = find_data_file('mqm_mixtures.csv', '../mqm/Mixtures MQM Summary R
 mqm_comp = load_mqm(mqm_comp_path)
 mqm_mix = load_mqm(mqm_mix_path)
 mqm_data = pd.concat([mqm_comp, mqm_mix], ignore_index=True)
-mqm_data = mqm_data.rename(columns={'Text': 'text', 'Chunk': 'chunk', 'Model': 'model'})
+mqm_data = shrink_keys(mqm_data.rename(columns={'Text': 'text', 'Chunk': 'chunk', 'Model': 'model'}))
 
 print(f"   MQM Data: {len(mqm_data)} rows")
 
-# Load Survey data
+# Load Survey data (comments contain quoted newlines, which the pyarrow engine rejects)
 survey_path = find_data_file('survey_responses.csv', '../surveys/survey-responses-1769097340109.csv')
-survey = pd.read_csv(survey_path)
+survey = pd.read_csv(survey_path, usecols=['Expert Name', 'Chunk ID', 'Preference Score',
+                                            'Left Translation', 'Right Translation'])
 print(f"   Survey Data: {len(survey)} rows")
 
 # ============================================================================
@@ -101,13 +158,10 @@ print(f"   Survey Data: {len(survey)} rows")
 
 print("\n[2] Merging datasets...")
 
-# Merge MT metrics with MQM TQS scores
-merged = pd.merge(
-    mt_metrics, 
-    mqm_data[['text', 'chunk', 'model', 'TQS', 'APT']], 
-    on=['text', 'chunk', 'model'],
-    how='inner'
-)
+# Merge MT metrics with MQM TQS scores: look the keys up in an MQM frame indexed
+# on (text, chunk, model); join on= keeps mt_metrics' row and column order
+mqm_scores = mqm_data.set_index(['text', 'chunk', 'model'])[['TQS', 'APT']]
+merged = mt_metrics.join(mqm_scores, on=['text', 'chunk', 'model'], how='inner').reset_index(drop=True)
 
 print(f"   Merged MT + MQM: {len(merged)} rows")
 
@@ -127,44 +181,34 @@ HUMAN_TRANS = ['human1', 'human2']
 
 def compute_model_preferences(survey_df):
     """Compute normalized preference scores for each AI model"""
-    results = []
+    left = survey_df['Left Translation']
+    right = survey_df['Right Translation']
+    score = survey_df['Preference Score']
     
-    for _, row in survey_df.iterrows():
-        left = row['Left Translation']
-        right = row['Right Translation']
-        score = row['Preference Score']
-        chunk = row['Chunk ID']
-        
-        # Determine which is AI and which is human
-        left_is_ai = left in AI_MODELS
-        right_is_ai = right in AI_MODELS
-        
-        if left_is_ai and not right_is_ai:
-            ai_model = left
-            # Score is negative if left preferred, so AI preference = -score when AI is on left
-            # Actually: negative score = prefer left, so if AI on left, negative = prefer AI
-            ai_preference = -score  # Negate because negative means left preferred
-        elif right_is_ai and not left_is_ai:
-            ai_model = right
-            # Positive score = prefer right, so if AI on right, positive = prefer AI
-            ai_preference = score
-        else:
-            continue  # Skip AI vs AI or human vs human
-        
-        results.append({
-            'chunk': chunk,
-            'model': ai_model,
-            'ai_preference': ai_preference,
-            'expert': row['Expert Name']
-        })
+    # Determine which is AI and which is human
+    left_is_ai = left.isin(AI_MODELS)
+    right_is_ai = right.isin(AI_MODELS)
+    
+    # Keep AI-vs-human rows only (skip AI vs AI or human vs human)
+    keep = left_is_ai != right_is_ai
+    
+    # Negative score = prefer left, positive = prefer right, so the AI preference
+    # is the score when the AI is on the right and its negation when on the left
+    results = pd.DataFrame({
+        'chunk': survey_df['Chunk ID'],
+        'model': right.where(right_is_ai, left),
+        'ai_preference': score.where(right_is_ai, -score),
+        'expert': survey_df['Expert Name']
+    })
     
-    return pd.DataFrame(results)
+    return results[keep].reset_index(drop=True)
 
 survey_prefs = compute_model_preferences(survey)
 
-# Average preference by chunk and model
-survey_by_chunk_model = survey_prefs.groupby(['chunk', 'model'])['ai_preference'].agg(['mean', 'std', 'count']).reset_index()
-survey_by_chunk_model.columns = ['chunk', 'model', 'survey_pref_mean', 'survey_pref_std', 'survey_n']
+# Average preference by chunk and model (named aggregation: one pass, final column names)
+survey_by_chunk_model = survey_prefs.groupby(['chunk', 'model'])['ai_preference'].agg(
+    survey_pref_mean='mean', survey_pref_std='std', survey_n='count'
+).reset_index()
 
 print(f"   Survey preferences computed: {len(survey_by_chunk_model)} chunk-model combinations")
 
@@ -175,20 +219,28 @@ print(f"   Survey preferences computed: {len(survey_by_chunk_model)} chunk-model
 # Since survey doesn't have text identifier, we need to aggregate differently
 # For correlation, we'll use model-level aggregates
 
-# Model-level MT metrics (averaged across chunks)
-mt_by_model = mt_metrics.groupby('model').mean(numeric_only=True).reset_index()
+# MT metrics by chunk and model (averaged across both texts); reused for the
+# survey correlations below
+mt_by_chunk_model = mt_metrics.groupby(['chunk', 'model'], observed=True).mean(numeric_only=True).reset_index()
+
+# Model-level MT metrics (averaged across chunks). Every (chunk, model) cell
+# holds one row per text, so averaging the ~60-row rollup equals averaging
+# mt_metrics directly
+mt_by_model = mt_by_chunk_model.groupby('model', observed=True).mean(numeric_only=True).reset_index()
 
 # Model-level MQM
-mqm_by_model = mqm_data.groupby('model')['TQS'].agg(['mean', 'std']).reset_index()
-mqm_by_model.columns = ['model', 'TQS_mean', 'TQS_std']
+mqm_by_model = mqm_data.groupby('model', observed=True)['TQS'].agg(TQS_mean='mean', TQS_std='std').reset_index()
 
 # Model-level survey preference
-survey_by_model = survey_prefs.groupby('model')['ai_preference'].agg(['mean', 'std', 'count']).reset_index()
-survey_by_model.columns = ['model', 'survey_pref', 'survey_std', 'survey_n']
+survey_by_model = survey_prefs.groupby('model')['ai_preference'].agg(
+    survey_pref='mean', survey_std='std', survey_n='count'
+).reset_index()
 
-# Merge model-level data
-model_level = pd.merge(mt_by_model, mqm_by_model, on='model')
-model_level = pd.merge(model_level, survey_by_model, on='model')
+# Merge model-level data (all three frames are keyed by model)
+model_level = pd.concat(
+    [frame.set_index('model') for frame in (mt_by_model, mqm_by_model, survey_by_model)],
+    axis=1, join='inner'
+).reset_index()
 
 print("\n[4] Model-level summary:")
 print(model_level.to_string(index=False))
@@ -209,26 +261,31 @@ print("-" * 70)
 
 correlation_results = []
 
-for metric in metrics:
-    if metric in merged.columns:
-        # Pearson correlation
-        pearson_r, pearson_p = pearsonr(merged[metric], merged['TQS'])
-        
-        # Spearman correlation
-        spearman_r, spearman_p = spearmanr(merged[metric], merged['TQS'])
-        
-        correlation_results.append({
-            'Metric': metric,
-            'Pearson r': pearson_r,
-            'Pearson p': pearson_p,
-            'Spearman ρ': spearman_r,
-            'Spearman p': spearman_p
-        })
-        
-        sig_p = "***" if pearson_p < 0.001 else "**" if pearson_p < 0.01 else "*" if pearson_p < 0.05 else ""
-        sig_s = "***" if spearman_p < 0.001 else "**" if spearman_p < 0.01 else "*" if spearman_p < 0.05 else ""
-        
-        print(f"{metric:12} | Pearson r = {pearson_r:+.4f} (p={pearson_p:.4f}){sig_p:4} | Spearman ρ = {spearman_r:+.4f} (p={spearman_p:.4f}){sig_s}")
+# All metrics against TQS at once: Pearson broadcast over the metric columns,
+# Spearman from one rank/correlation matrix (last column = TQS)
+present_metrics = [metric for metric in metrics if metric in merged.columns]
+metric_values = merged[present_metrics].to_numpy(dtype=np.float64)
+tqs_values = merged['TQS'].to_numpy(dtype=np.float64)
+
+pearson = pearsonr(metric_values, tqs_values[:, None], axis=0)
+spearman = spearmanr(np.column_stack([metric_values, tqs_values]))
+spearman_rs = np.atleast_2d(spearman.statistic)[:-1, -1]
+spearman_ps = np.atleast_2d(spearman.pvalue)[:-1, -1]
+
+for metric, pearson_r, pearson_p, spearman_r, spearman_p in zip(
+        present_metrics, pearson.statistic, pearson.pvalue, spearman_rs, spearman_ps):
+    correlation_results.append({
+        'Metric': metric,
+        'Pearson r': pearson_r,
+        'Pearson p': pearson_p,
+        'Spearman ρ': spearman_r,
+        'Spearman p': spearman_p
+    })
+    
+    sig_p = stars(pearson_p)
+    sig_s = stars(spearman_p)
+    
+    print(f"{metric:12} | Pearson r = {pearson_r:+.4f} (p={pearson_p:.4f}){sig_p:4} | Spearman ρ = {spearman_r:+.4f} (p={spearman_p:.4f}){sig_s}")
 
 corr_df = pd.DataFrame(correlation_results)
 
@@ -243,10 +300,7 @@ print("-" * 70)
 # Survey has chunks 1-10, but we don't know which text they're from
 # Let's assume chunks 1-10 in survey map to the "Mixtures" text based on typical study design
 
-# Aggregate MT metrics by chunk and model (across both texts)
-mt_by_chunk_model = mt_metrics.groupby(['chunk', 'model']).mean(numeric_only=True).reset_index()
-
-# Merge with survey preferences
+# Merge MT metrics by chunk and model (across both texts) with survey preferences
 survey_mt_merged = pd.merge(
     survey_by_chunk_model,
     mt_by_chunk_model,
@@ -267,7 +321,7 @@ for metric in metrics:
             'p-value': p_val
         })
         
-        sig = "***" if p_val < 0.001 else "**" if p_val < 0.01 else "*" if p_val < 0.05 else ""
+        sig = stars(p_val)
         print(f"{metric:12} | Kendall's τ = {tau:+.4f} (p={p_val:.4f}){sig}")
 
 kendall_df = pd.DataFrame(kendall_results)
@@ -287,29 +341,15 @@ print("\n┌─────────────┬────────
 print("│ Metric      │ Pearson r (vs TQS)           │ Spearman ρ (vs TQS)          │ Kendall's τ (Survey)│")
 print("├─────────────┼──────────────────────────────┼──────────────────────────────┼─────────────────────┤")
 
-for _, row in summary_df.iterrows():
-    metric = row['Metric']
-    
-    if pd.notna(row.get('Pearson r')):
-        p_sig = "***" if row['Pearson p'] < 0.001 else "**" if row['Pearson p'] < 0.01 else "*" if row['Pearson p'] < 0.05 else ""
-        pearson_str = f"{row['Pearson r']:+.3f}{p_sig}"
-    else:
-        pearson_str = "N/A"
-    
-    if pd.notna(row.get('Spearman ρ')):
-        s_sig = "***" if row['Spearman p'] < 0.001 else "**" if row['Spearman p'] < 0.01 else "*" if row['Spearman p'] < 0.05 else ""
-        spearman_str = f"{row['Spearman ρ']:+.3f}{s_sig}"
-    else:
-        spearman_str = "N/A"
-    
-    if pd.notna(row.get("Kendall's τ")):
-        k_sig = "***" if row['p-value'] < 0.001 else "**" if row['p-value'] < 0.01 else "*" if row['p-value'] < 0.05 else ""
-        kendall_val = row["Kendall's τ"]
-        kendall_str = f"{kendall_val:+.3f}{k_sig}"
-    else:
-        kendall_str = "N/A"
-    
-    print(f"│ {metric:<11} │ {pearson_str:<28} │ {spearman_str:<28} │ {kendall_str:<19} │")
+# Format each coefficient column in one pass, then join the table rows column-wise
+pearson_strs = format_coefficients(summary_df['Pearson r'], summary_df['Pearson p'], 3)
+spearman_strs = format_coefficients(summary_df['Spearman ρ'], summary_df['Spearman p'], 3)
+kendall_strs = format_coefficients(summary_df["Kendall's τ"], summary_df['p-value'], 3)
+
+metric_strs = summary_df['Metric'].reset_index(drop=True)
+
+print(('│ ' + metric_strs.str.ljust(11) + ' │ ' + pearson_strs.str.ljust(28) + ' │ ' +
+       spearman_strs.str.ljust(28) + ' │ ' + kendall_strs.str.ljust(19) + ' │').str.cat(sep='\n'))
 
 print("└─────────────┴──────────────────────────────┴──────────────────────────────┴─────────────────────┘")
 print("Significance: * p<0.05, ** p<0.01, *** p<0.001")
@@ -320,8 +360,9 @@ print("Significance: * p<0.05, ** p<0.01, *** p<0.001")
 
 def create_correlation_heatmap(corr_df, kendall_df, filename):
     """Create heatmap of correlation coefficients"""
+    setup_matplotlib()
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = plt.subplots(figsize=(10, 6), layout='tight')
     
     # Prepare data matrix
     metrics = corr_df['Metric'].tolist()
@@ -337,14 +378,14 @@ def create_correlation_heatmap(corr_df, kendall_df, filename):
         # Pearson
         r = corr_df.loc[corr_df['Metric'] == metric, 'Pearson r'].values[0]
         p = corr_df.loc[corr_df['Metric'] == metric, 'Pearson p'].values[0]
-        sig = "***" if p < 0.001 else "**" if p < 0.01 else "*" if p < 0.05 else ""
+        sig = stars(p)
         row_data.append(r)
         row_annot.append(f"{r:.3f}{sig}")
         
         # Spearman
         rho = corr_df.loc[corr_df['Metric'] == metric, 'Spearman ρ'].values[0]
         p = corr_df.loc[corr_df['Metric'] == metric, 'Spearman p'].values[0]
-        sig = "***" if p < 0.001 else "**" if p < 0.01 else "*" if p < 0.05 else ""
+        sig = stars(p)
         row_data.append(rho)
         row_annot.append(f"{rho:.3f}{sig}")
         
@@ -352,7 +393,7 @@ def create_correlation_heatmap(corr_df, kendall_df, filename):
         if metric in kendall_df['Metric'].values:
             tau = kendall_df.loc[kendall_df['Metric'] == metric, "Kendall's τ"].values[0]
             p = kendall_df.loc[kendall_df['Metric'] == metric, 'p-value'].values[0]
-            sig = "***" if p < 0.001 else "**" if p < 0.01 else "*" if p < 0.05 else ""
+            sig = stars(p)
             row_data.append(tau)
             row_annot.append(f"{tau:.3f}{sig}")
         else:
@@ -385,12 +426,12 @@ def create_correlation_heatmap(corr_df, kendall_df, filename):
     ax.set_title('Automated Metrics vs Human Evaluation Correlations\n(* p<0.05, ** p<0.01, *** p<0.001)', 
                 fontsize=13, fontweight='bold', pad=15)
     
-    plt.tight_layout()
-    plt.savefig(filename, bbox_inches='tight', dpi=300, facecolor='white')
+    fig.savefig(filename, bbox_inches='tight', facecolor='white')
     plt.close()
     print(f"Saved: {filename}")
 
-create_correlation_heatmap(corr_df, kendall_df, 'charts/chart1_correlation_heatmap.png')
+if MAKE_CHARTS:
+    create_correlation_heatmap(corr_df, kendall_df, 'charts/chart1_correlation_heatmap.png')
 
 # ============================================================================
 # CHART 2: Scatter plots - Best correlating metrics vs TQS
@@ -398,49 +439,77 @@ create_correlation_heatmap(corr_df, kendall_df, 'charts/chart1_correlation_heatm
 
 def create_scatter_plots(merged_df, filename):
     """Create scatter plots of top metrics vs TQS"""
+    setup_matplotlib()
     
     # Select top metrics based on correlation
     top_metrics = ['BERTScore', 'COMET', 'chrF++', 'BLEU-4']
     
-    fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+    fig, axes = plt.subplots(2, 2, figsize=(12, 10), layout='tight')
     
     colors = {'claude': '#8B5CF6', 'gemini': '#10B981', 'openai': '#3B82F6'}
     
+    # Metric columns as one contiguous matrix and TQS as a vector, extracted
+    # once; all four fits then come from one centred cross-product
+    X = np.ascontiguousarray(merged_df[top_metrics].to_numpy(dtype=np.float64))
+    y = merged_df['TQS'].to_numpy(dtype=np.float64)
+    n = len(y)
+    x_means = X.mean(axis=0)
+    y_mean = y.mean()
+    X0 = X - x_means
+    y0 = y - y_mean
+    sxx = np.einsum('ij,ij->j', X0, X0)
+    sxy = X0.T @ y0
+    sy = y0.dot(y0)
+    slopes = sxy / sxx
+    intercepts = y_mean - slopes * x_means
+    rs = sxy / np.sqrt(sxx * sy)
+    # Two-sided p-value of r with n - 2 d.f.: I_{1-r²}((n-2)/2, 1/2), one betainc for all panels
+    p_vals = betainc((n - 2) / 2, 0.5, 1 - rs * rs)
+    
+    # One scatter call per panel: rows grouped by model (claude, gemini, openai)
+    # so points overlap in the same order as separate per-model calls, coloured
+    # per point, with the legend handles built once
+    model_order = ['claude', 'gemini', 'openai']
+    model_codes = merged_df['model'].map({model: i for i, model in enumerate(model_order)}).to_numpy()
+    rows = np.flatnonzero(~np.isnan(model_codes))
+    rows = rows[np.argsort(model_codes[rows], kind='stable')]
+    point_colors = merged_df['model'].map(colors).to_numpy()[rows]
+    y_points = y[rows]
+    legend_handles = [
+        Line2D([], [], linestyle='', marker='o', markersize=np.sqrt(60), color=colors[model],
+               markeredgecolor='white', markeredgewidth=0.5, alpha=0.7, label=model.capitalize())
+        for model in model_order
+    ]
+    
     for idx, metric in enumerate(top_metrics):
         ax = axes[idx // 2, idx % 2]
+        x = X[:, idx]
         
-        for model in ['claude', 'gemini', 'openai']:
-            model_data = merged_df[merged_df['model'] == model]
-            ax.scatter(model_data[metric], model_data['TQS'], 
-                      label=model.capitalize(), color=colors[model], 
-                      alpha=0.7, s=60, edgecolor='white', linewidth=0.5)
+        ax.scatter(x[rows], y_points, c=point_colors,
+                  alpha=0.7, s=60, edgecolor='white', linewidth=0.5)
         
         # Add regression line
-        x = merged_df[metric]
-        y = merged_df['TQS']
-        z = np.polyfit(x, y, 1)
-        p = np.poly1d(z)
         x_line = np.linspace(x.min(), x.max(), 100)
-        ax.plot(x_line, p(x_line), 'r--', alpha=0.5, linewidth=2)
+        ax.plot(x_line, slopes[idx] * x_line + intercepts[idx], 'r--', alpha=0.5, linewidth=2)
         
         # Add correlation annotation
-        r, p_val = pearsonr(x, y)
-        sig = "***" if p_val < 0.001 else "**" if p_val < 0.01 else "*" if p_val < 0.05 else ""
+        r, p_val = rs[idx], p_vals[idx]
+        sig = stars(p_val)
         ax.annotate(f'r = {r:.3f}{sig}', xy=(0.05, 0.95), xycoords='axes fraction',
                    fontsize=12, fontweight='bold', verticalalignment='top')
         
         ax.set_xlabel(metric, fontsize=12, fontweight='bold')
         ax.set_ylabel('TQS (MQM)', fontsize=12, fontweight='bold')
-        ax.legend(loc='lower right', fontsize=9)
+        ax.legend(handles=legend_handles, loc='lower right', fontsize=9)
     
     fig.suptitle('Automated Metrics vs MQM Translation Quality Score', 
                 fontsize=14, fontweight='bold', y=1.02)
-    plt.tight_layout()
-    plt.savefig(filename, bbox_inches='tight', dpi=300, facecolor='white')
+    fig.savefig(filename, bbox_inches='tight', facecolor='white')
     plt.close()
     print(f"Saved: {filename}")
 
-create_scatter_plots(merged, 'charts/chart2_scatter_tqs.png')
+if MAKE_CHARTS:
+    create_scatter_plots(merged, 'charts/chart2_scatter_tqs.png')
 
 # ============================================================================
 # CHART 3: Bar chart comparing correlation strengths
@@ -448,8 +517,9 @@ create_scatter_plots(merged, 'charts/chart2_scatter_tqs.png')
 
 def create_correlation_bar_chart(corr_df, kendall_df, filename):
     """Create bar chart comparing correlation strengths"""
+    setup_matplotlib()
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = plt.subplots(figsize=(12, 6), layout='tight')
     
     metrics = corr_df['Metric'].tolist()
     x = np.arange(len(metrics))
@@ -483,18 +553,19 @@ def create_correlation_bar_chart(corr_df, kendall_df, filename):
     ax.set_title('Correlation Strength: Automated Metrics vs Human Evaluations', 
                 fontsize=14, fontweight='bold', pad=15)
     
-    plt.tight_layout()
-    plt.savefig(filename, bbox_inches='tight', dpi=300, facecolor='white')
+    fig.savefig(filename, bbox_inches='tight', facecolor='white')
     plt.close()
     print(f"Saved: {filename}")
 
-create_correlation_bar_chart(corr_df, kendall_df, 'charts/chart3_correlation_bars.png')
+if MAKE_CHARTS:
+    create_correlation_bar_chart(corr_df, kendall_df, 'charts/chart3_correlation_bars.png')
 
 # ============================================================================
 # GENERATE REPORT
 # ============================================================================
 
-report = f"""
+report_buf = io.StringIO()
+report_buf.write(f"""
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║              METRICS CORRELATION ANALYSIS REPORT                             ║
 ║          Automated MT Metrics vs Human Evaluations                           ║
@@ -538,33 +609,19 @@ with human evaluation scores. We compare:
     ┌─────────────┬────────────────────┬────────────────────┬──────────────────┐
     │ Metric      │ Pearson r (TQS)    │ Spearman ρ (TQS)   │ Kendall τ (Surv) │
     ├─────────────┼────────────────────┼────────────────────┼──────────────────┤
-"""
+""")
 
-for _, row in summary_df.iterrows():
-    metric = row['Metric']
-    
-    if pd.notna(row.get('Pearson r')):
-        p_sig = "***" if row['Pearson p'] < 0.001 else "**" if row['Pearson p'] < 0.01 else "*" if row['Pearson p'] < 0.05 else ""
-        pearson_str = f"{row['Pearson r']:+.4f}{p_sig:3}"
-    else:
-        pearson_str = "N/A"
-    
-    if pd.notna(row.get('Spearman ρ')):
-        s_sig = "***" if row['Spearman p'] < 0.001 else "**" if row['Spearman p'] < 0.01 else "*" if row['Spearman p'] < 0.05 else ""
-        spearman_str = f"{row['Spearman ρ']:+.4f}{s_sig:3}"
-    else:
-        spearman_str = "N/A"
-    
-    if pd.notna(row.get("Kendall's τ")):
-        k_sig = "***" if row['p-value'] < 0.001 else "**" if row['p-value'] < 0.01 else "*" if row['p-value'] < 0.05 else ""
-        kendall_val = row["Kendall's τ"]
-        kendall_str = f"{kendall_val:+.4f}{k_sig:3}"
-    else:
-        kendall_str = "N/A"
-    
-    report += f"    │ {metric:<11} │ {pearson_str:<18} │ {spearman_str:<18} │ {kendall_str:<16} │\n"
+# Format each coefficient column in one pass, then join the table rows column-wise
+pearson_strs = format_coefficients(summary_df['Pearson r'], summary_df['Pearson p'], 4, star_width=3)
+spearman_strs = format_coefficients(summary_df['Spearman ρ'], summary_df['Spearman p'], 4, star_width=3)
+kendall_strs = format_coefficients(summary_df["Kendall's τ"], summary_df['p-value'], 4, star_width=3)
+
+metric_strs = summary_df['Metric'].reset_index(drop=True)
 
-report += """    └─────────────┴────────────────────┴────────────────────┴──────────────────┘
+report_buf.write(('    │ ' + metric_strs.str.ljust(11) + ' │ ' + pearson_strs.str.ljust(18) + ' │ ' +
+                 spearman_strs.str.ljust(18) + ' │ ' + kendall_strs.str.ljust(16) + ' │\n').str.cat())
+
+report_buf.write("""    └─────────────┴────────────────────┴────────────────────┴──────────────────┘
     
     Significance: * p<0.05, ** p<0.01, *** p<0.001
 
@@ -580,32 +637,32 @@ report += """    └─────────────┴──────
 
     Key Findings:
     ─────────────
-"""
+""")
 
 # Analyze results
 best_tqs_metric = corr_df.loc[corr_df['Pearson r'].abs().idxmax(), 'Metric']
 best_tqs_r = corr_df.loc[corr_df['Pearson r'].abs().idxmax(), 'Pearson r']
 
-report += f"""
+report_buf.write(f"""
     1. Best TQS Predictor: {best_tqs_metric}
        - Pearson r = {best_tqs_r:.4f}
        - This metric best predicts the expert MQM quality scores.
-"""
+""")
 
 if len(kendall_df) > 0:
     best_survey_metric = kendall_df.loc[kendall_df["Kendall's τ"].abs().idxmax(), 'Metric']
     best_survey_tau = kendall_df.loc[kendall_df["Kendall's τ"].abs().idxmax(), "Kendall's τ"]
-    report += f"""
+    report_buf.write(f"""
     2. Best Survey Predictor: {best_survey_metric}
        - Kendall's τ = {best_survey_tau:.4f}
        - This metric best predicts blind expert preferences.
-"""
+""")
 
 # Check for significant correlations
 sig_tqs = corr_df[corr_df['Pearson p'] < 0.05]['Metric'].tolist()
 sig_survey = kendall_df[kendall_df['p-value'] < 0.05]['Metric'].tolist() if len(kendall_df) > 0 else []
 
-report += f"""
+report_buf.write(f"""
     3. Statistically Significant Correlations with TQS:
        {', '.join(sig_tqs) if sig_tqs else 'None at p<0.05'}
     
@@ -615,44 +672,44 @@ report += f"""
 ═══════════════════════════════════════════════════════════════════════════════
                               CONCLUSIONS
 ═══════════════════════════════════════════════════════════════════════════════
-"""
+""")
 
 # Generate conclusions based on correlation strengths
 avg_tqs_corr = corr_df['Pearson r'].abs().mean()
 avg_survey_corr = kendall_df["Kendall's τ"].abs().mean() if len(kendall_df) > 0 else 0
 
 if avg_tqs_corr > 0.5:
-    report += """
+    report_buf.write("""
     • Automated metrics show MODERATE TO STRONG correlation with MQM expert
       annotation, suggesting they can serve as reasonable proxies for
       translation quality assessment.
-"""
+""")
 elif avg_tqs_corr > 0.3:
-    report += """
+    report_buf.write("""
     • Automated metrics show MODERATE correlation with MQM expert annotation.
       While useful for ranking, they should not replace human evaluation
       for high-stakes assessments.
-"""
+""")
 else:
-    report += """
+    report_buf.write("""
     • Automated metrics show WEAK correlation with MQM expert annotation.
       This suggests automated metrics may not reliably predict human
       quality judgments for this specialized translation domain.
-"""
+""")
 
 if avg_survey_corr > 0.3:
-    report += """
+    report_buf.write("""
     • Automated metrics show meaningful correlation with blind expert
       preferences, validating their use in comparative evaluation.
-"""
+""")
 else:
-    report += """
+    report_buf.write("""
     • Automated metrics show limited correlation with blind expert
       preferences, suggesting human evaluation remains essential for
       this specialized domain (ancient Greek medical texts).
-"""
+""")
 
-report += """
+report_buf.write("""
 ═══════════════════════════════════════════════════════════════════════════════
                             GENERATED OUTPUTS
 ═══════════════════════════════════════════════════════════════════════════════
@@ -669,7 +726,9 @@ report += """
     2. correlation_data.csv            - Raw correlation data
 
 ═══════════════════════════════════════════════════════════════════════════════
-"""
+""")
+
+report = report_buf.getvalue()
 
 # Save report
 with open('reports/correlation_analysis_report.txt', 'w') as f:
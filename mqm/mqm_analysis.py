@@ -6,19 +6,34 @@ Comparing AI translations of Galen's Greek medical texts
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')  # charts are only written to disk; no GUI backend
+from matplotlib.figure import Figure
 import matplotlib.patches as mpatches
 from scipy import stats
+from itertools import combinations
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import multiprocessing
+import argparse
 import os
+import sys
 import warnings
 warnings.filterwarnings('ignore')
 
+parser = argparse.ArgumentParser(description="MQM analysis of the AI translations of Galen's texts")
+parser.add_argument('--high-dpi', action='store_true',
+                    help='Save charts at 300 dpi for publication (default: 150 dpi)')
+args = parser.parse_args()
+
+# Chart resolution: 150 dpi by default, 300 dpi for publication with --high-dpi
+CHART_DPI = 300 if args.high_dpi else 150
+
 # Create output directories
 os.makedirs('charts', exist_ok=True)
 os.makedirs('reports', exist_ok=True)
 
 # Set style - clean academic look
-plt.rcParams.update({
+matplotlib.rcParams.update({
     'font.family': 'DejaVu Sans',
     'font.size': 11,
     'axes.labelsize': 13,
@@ -34,26 +49,63 @@ plt.rcParams.update({
 })
 
 # Load and clean data
+# Summary sheet columns after the leading blank one; rows start under the 3-line header block
+MQM_COLUMNS = ['Text', 'Chunk', 'Translation', 'Model', 'Word Count', 'APT', 'TQS',
+               'Neutral', 'Minor', 'Major', 'Critical', 
+               'Term_Accuracy', 'Term_Consistency', 'Term_Total',
+               'Acc_Mistranslation', 'Acc_Overtranslation', 'Acc_Undertranslation', 
+               'Acc_Addition', 'Acc_Omission', 'Acc_Total']
+# Declared up front so the parser skips type inference; numeric columns stay float64
+# because the sheet's footer rows leave them empty (Chunk is cast to int once they're dropped)
+MQM_DTYPES = {col: 'float64' for col in MQM_COLUMNS} | {'Text': 'str', 'Translation': 'str', 'Model': 'str'}
+
 def load_mqm_data(filepath):
-    df = pd.read_csv(filepath, skiprows=2)
-    # Clean column names
-    df.columns = ['blank', 'Text', 'Chunk', 'Translation', 'Model', 'Word Count', 'APT', 'TQS',
-                  'Neutral', 'Minor', 'Major', 'Critical', 
-                  'Term_Accuracy', 'Term_Consistency', 'Term_Total',
-                  'Acc_Mistranslation', 'Acc_Overtranslation', 'Acc_Undertranslation', 
-                  'Acc_Addition', 'Acc_Omission', 'Acc_Total']
-    df = df.drop('blank', axis=1)
+    df = pd.read_csv(filepath, header=None, skiprows=3, usecols=range(1, 21),
+                     names=['blank'] + MQM_COLUMNS, dtype=MQM_DTYPES)
     # Remove empty rows
     df = df.dropna(subset=['Text', 'Chunk', 'Model'])
     df['Chunk'] = df['Chunk'].astype(int)
     return df
 
-# Load both datasets
-comp_df = load_mqm_data('Comp MQM Summary Report Unblinded.xlsx - Summary.csv')
-mix_df = load_mqm_data('Mixtures MQM Summary Report Unblinded.xlsx - Summary.csv')
+MQM_SOURCES = [
+    'Comp MQM Summary Report Unblinded.xlsx - Summary.csv',
+    'Mixtures MQM Summary Report Unblinded.xlsx - Summary.csv'
+]
+# Cleaned, combined data from a previous run; reused while newer than the CSVs and this script
+MQM_CACHE = 'reports/mqm_clean.parquet'
+
+def load_all_mqm_data():
+    sources = MQM_SOURCES + [os.path.abspath(__file__)]
+    if os.path.exists(MQM_CACHE) and os.path.getmtime(MQM_CACHE) >= max(map(os.path.getmtime, sources)):
+        try:
+            return pd.read_parquet(MQM_CACHE)
+        except ImportError:
+            pass  # no parquet engine (pyarrow/fastparquet); parse the CSVs
+        except (OSError, ValueError) as e:
+            # Truncated or corrupt cache (pyarrow's ArrowInvalid is a ValueError); rebuild it
+            print(f"Ignoring unreadable cache {MQM_CACHE}: {e}")
+    
+    # Load both datasets concurrently (pandas' C parser releases the GIL while parsing)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        comp_df, mix_df = executor.map(load_mqm_data, MQM_SOURCES)
+    
+    # Combine
+    df = pd.concat([comp_df, mix_df], ignore_index=True)
+    # Written under a temporary name and moved into place, so an interrupted
+    # write never leaves a partial cache behind
+    tmp_cache = MQM_CACHE + '.tmp'
+    try:
+        df.to_parquet(tmp_cache, compression='zstd')
+        os.replace(tmp_cache, MQM_CACHE)
+    except ImportError:
+        pass
+    return df
+
+df = load_all_mqm_data()
 
-# Combine
-df = pd.concat([comp_df, mix_df], ignore_index=True)
+# Integer-coded grouping/filter keys (categories in the order used throughout)
+df['Model'] = pd.Categorical(df['Model'], categories=['claude', 'gemini', 'openai'])
+df['Text'] = pd.Categorical(df['Text'], categories=['Comp', 'Mixtures'])
 
 # Model display names
 MODEL_NAMES = {
@@ -69,6 +121,20 @@ MODEL_COLORS = {
     'openai': '#3B82F6'   # Blue
 }
 
+# Significance levels: p < 0.001, < 0.01, < 0.05, otherwise (or NaN) not significant
+_SIG_THRESH = np.array([0.001, 0.01, 0.05])
+_STAR_LABEL = np.array(['***', '**', '*', ''])
+_SIG_LABEL = np.array(['★★★ Highly significant (p < 0.001)', '★★ Very significant (p < 0.01)',
+                       '★ Significant (p < 0.05)', 'Not statistically significant'])
+
+def significance_level(p):
+    """Index into the significance labels for a p-value (or an array of them)"""
+    return np.searchsorted(_SIG_THRESH, np.asarray(p), side='right')
+
+def stars(p):
+    """Significance stars for a p-value, or an array of them for an array of p-values"""
+    return _STAR_LABEL[significance_level(p)]
+
 print("=" * 80)
 print("MQM ANALYSIS: AI TRANSLATION QUALITY OF GALEN'S GREEK MEDICAL TEXTS")
 print("=" * 80)
@@ -82,9 +148,9 @@ print("DATASET SUMMARY")
 print("=" * 80)
 
 print(f"\nTotal evaluations: {len(df)}")
-print(f"Texts evaluated: {df['Text'].unique()}")
+print(f"Texts evaluated: {', '.join(df['Text'].unique())}")
 print(f"Chunks per text: {df['Chunk'].nunique()}")
-print(f"Models: {df['Model'].unique()}")
+print(f"Models: {', '.join(df['Model'].unique())}")
 
 # ============================================================================
 # TQS BY MODEL (AGGREGATE)
@@ -94,7 +160,7 @@ print("\n" + "-" * 60)
 print("TQS SCORES BY MODEL (Aggregate)")
 print("-" * 60)
 
-model_stats = df.groupby('Model')['TQS'].agg(['mean', 'std', 'min', 'max', 'count'])
+model_stats = df.groupby('Model', observed=True)['TQS'].agg(['mean', 'std', 'min', 'max', 'count'])
 model_stats = model_stats.sort_values('mean', ascending=False)
 
 for model, row in model_stats.iterrows():
@@ -104,6 +170,13 @@ for model, row in model_stats.iterrows():
     print(f"  Range:    {row['min']:.2f} - {row['max']:.2f}")
     print(f"  N:        {int(row['count'])}")
 
+# Split the data once by model, by text and by (text, model); the printouts,
+# charts, statistics and report below take their sub-frames from these
+# instead of re-masking df
+model_groups = dict(tuple(df.groupby('Model', observed=True)))
+text_groups = dict(tuple(df.groupby('Text', observed=True)))
+text_model_groups = dict(tuple(df.groupby(['Text', 'Model'], observed=True)))
+
 # ============================================================================
 # TQS BY MODEL AND TEXT
 # ============================================================================
@@ -114,8 +187,8 @@ print("-" * 60)
 
 for text in ['Comp', 'Mixtures']:
     print(f"\n{text}:")
-    text_df = df[df['Text'] == text]
-    text_stats = text_df.groupby('Model')['TQS'].agg(['mean', 'std'])
+    text_df = text_groups[text]
+    text_stats = text_df.groupby('Model', observed=True)['TQS'].agg(['mean', 'std'])
     text_stats = text_stats.sort_values('mean', ascending=False)
     for model, row in text_stats.iterrows():
         print(f"  {MODEL_NAMES[model]:10} Mean: {row['mean']:6.2f}  Std: {row['std']:6.2f}")
@@ -128,22 +201,23 @@ print("\n" + "-" * 60)
 print("TQS SCORES BY CHUNK")
 print("-" * 60)
 
-for text in ['Comp', 'Mixtures']:
+# Rows holding the top TQS of their (Text, Chunk); a chunk with several is a tie
+chunk_keys = ['Text', 'Chunk']
+top_rows = df[df['TQS'] == df.groupby(chunk_keys, observed=True)['TQS'].transform('max')]
+
+# One wide (Text, Chunk) x model TQS table for the printout and the report; a
+# missing score shows as 0, and the best model is the first top row in data order
+chunk_tqs = df.pivot_table(index=chunk_keys, columns='Model', values='TQS', observed=True,
+                           fill_value=0).reindex(columns=['claude', 'gemini', 'openai'], fill_value=0)
+chunk_tqs['Best'] = top_rows.drop_duplicates(chunk_keys).set_index(chunk_keys)['Model']
+
+for text, text_tqs in chunk_tqs.groupby(level='Text', observed=True):
     print(f"\n{text}:")
     print(f"{'Chunk':>6} | {'Claude':>10} | {'Gemini':>10} | {'ChatGPT':>10} | {'Best':>10}")
     print("-" * 60)
     
-    text_df = df[df['Text'] == text]
-    
-    for chunk in sorted(text_df['Chunk'].unique()):
-        chunk_df = text_df[text_df['Chunk'] == chunk]
-        scores = {}
-        for _, row in chunk_df.iterrows():
-            scores[row['Model']] = row['TQS']
-        
-        best_model = max(scores, key=scores.get)
-        
-        print(f"{chunk:>6} | {scores.get('claude', 0):>10.2f} | {scores.get('gemini', 0):>10.2f} | {scores.get('openai', 0):>10.2f} | {MODEL_NAMES[best_model]:>10}")
+    for (_, chunk), c_score, g_score, o_score, best_model in text_tqs.itertuples():
+        print(f"{chunk:>6} | {c_score:>10.2f} | {g_score:>10.2f} | {o_score:>10.2f} | {MODEL_NAMES[best_model]:>10}")
 
 # ============================================================================
 # ERROR ANALYSIS
@@ -154,26 +228,27 @@ print("ERROR ANALYSIS BY MODEL")
 print("-" * 60)
 
 error_cols = ['Neutral', 'Minor', 'Major', 'Critical']
-error_stats = df.groupby('Model')[error_cols].sum()
+error_stats = df.groupby('Model', observed=True)[error_cols].sum()
 
 print("\nTotal Errors by Severity:")
 print(error_stats)
 
 print("\nMean Errors per Chunk:")
-error_means = df.groupby('Model')[error_cols].mean()
+error_means = df.groupby('Model', observed=True)[error_cols].mean()
 print(error_means.round(2))
 
 # ============================================================================
 # CHART 1: TQS by Model (Box Plot)
 # ============================================================================
 
-def create_tqs_boxplot(data, filename):
-    fig, ax = plt.subplots(figsize=(9, 6))
+def create_tqs_boxplot(model_groups, filename):
+    fig = Figure(figsize=(9, 6))
+    ax = fig.subplots()
     
     models = ['claude', 'gemini', 'openai']
     positions = [0, 1, 2]
     
-    box_data = [data[data['Model'] == m]['TQS'].values for m in models]
+    box_data = [model_groups[m]['TQS'].to_numpy() for m in models]
     
     bp = ax.boxplot(box_data, positions=positions, widths=0.5, patch_artist=True,
                     medianprops=dict(color='black', linewidth=2),
@@ -187,10 +262,9 @@ def create_tqs_boxplot(data, filename):
         patch.set_linewidth(1.5)
     
     # Add individual points with jitter
-    np.random.seed(42)
-    for i, model in enumerate(models):
-        y = data[data['Model'] == model]['TQS'].values
-        x = np.random.normal(i, 0.08, size=len(y))
+    rng = np.random.default_rng(42)
+    for i, (model, y) in enumerate(zip(models, box_data)):
+        x = rng.normal(i, 0.08, size=len(y))
         ax.scatter(x, y, alpha=0.7, color=MODEL_COLORS[model], 
                   edgecolor='black', linewidth=0.5, s=60, zorder=5)
     
@@ -202,45 +276,42 @@ def create_tqs_boxplot(data, filename):
     
     # Add mean annotations with better positioning
     for i, model in enumerate(models):
-        mean_val = data[data['Model'] == model]['TQS'].mean()
+        mean_val = model_groups[model]['TQS'].mean()
         ax.annotate(f'Mean: {mean_val:.1f}', xy=(i, 105), ha='center',
                    fontsize=11, fontweight='bold', color=MODEL_COLORS[model])
     
     ax.set_title('Translation Quality Score (TQS) Distribution by AI Model', 
                 fontsize=15, fontweight='bold', pad=20)
     
-    plt.tight_layout()
-    plt.savefig(filename, bbox_inches='tight', dpi=300, facecolor='white')
-    plt.close()
-    print(f"Saved: {filename}")
-
-create_tqs_boxplot(df, 'charts/chart1_tqs_boxplot.png')
+    fig.tight_layout()
+    fig.savefig(filename, bbox_inches='tight', dpi=CHART_DPI, facecolor='white')
 
 # ============================================================================
 # CHART 2: TQS by Chunk and Model (Heatmap)
 # ============================================================================
 
-def create_tqs_heatmap(data, filename):
-    fig, axes = plt.subplots(1, 2, figsize=(12, 10), gridspec_kw={'wspace': 0.3})
+def create_tqs_heatmap(text_groups, filename):
+    fig = Figure(figsize=(12, 10))
+    axes = fig.subplots(1, 2, gridspec_kw={'wspace': 0.3})
     
     for ax_idx, text in enumerate(['Comp', 'Mixtures']):
         ax = axes[ax_idx]
-        text_df = data[data['Text'] == text]
+        text_df = text_groups[text]
         
         # Create pivot table
         pivot = text_df.pivot(index='Chunk', columns='Model', values='TQS')
         pivot = pivot[['claude', 'gemini', 'openai']]  # Reorder columns
         
         # Create heatmap
-        im = ax.imshow(pivot.values, cmap='RdYlGn', vmin=0, vmax=100, aspect=0.6)
+        values = pivot.to_numpy()
+        im = ax.imshow(values, cmap='RdYlGn', vmin=0, vmax=100, aspect=0.6)
         
-        # Add text annotations
-        for i in range(len(pivot)):
-            for j in range(len(pivot.columns)):
-                val = pivot.iloc[i, j]
-                text_color = 'white' if val < 35 or val > 85 else 'black'
-                ax.text(j, i, f'{val:.1f}', ha='center', va='center', 
-                       fontsize=11, color=text_color, fontweight='bold')
+        # Add text annotations (white on the dark ends of the colour map)
+        text_colors = np.where((values < 35) | (values > 85), 'white', 'black')
+        for i in range(values.shape[0]):
+            for j in range(values.shape[1]):
+                ax.text(j, i, f'{values[i, j]:.1f}', ha='center', va='center', 
+                       fontsize=11, color=text_colors[i, j], fontweight='bold')
         
         ax.set_xticks(range(len(pivot.columns)))
         ax.set_xticklabels([MODEL_NAMES[m] for m in pivot.columns], fontsize=12, fontweight='bold')
@@ -264,25 +335,21 @@ def create_tqs_heatmap(data, filename):
     fig.suptitle('Translation Quality Score by Chunk and Model\n(Green = High Quality, Red = Low Quality)', 
                 fontsize=15, fontweight='bold', y=0.98)
     
-    plt.savefig(filename, bbox_inches='tight', dpi=300, facecolor='white')
-    plt.close()
-    print(f"Saved: {filename}")
-
-create_tqs_heatmap(df, 'charts/chart2_tqs_heatmap.png')
+    fig.savefig(filename, bbox_inches='tight', dpi=CHART_DPI, facecolor='white')
 
 # ============================================================================
 # CHART 3: TQS Line Plot by Chunk
 # ============================================================================
 
-def create_tqs_lineplot(data, filename):
-    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+def create_tqs_lineplot(text_model_groups, filename):
+    fig = Figure(figsize=(14, 6))
+    axes = fig.subplots(1, 2)
     
     for ax_idx, text in enumerate(['Comp', 'Mixtures']):
         ax = axes[ax_idx]
-        text_df = data[data['Text'] == text]
         
         for model in ['claude', 'gemini', 'openai']:
-            model_df = text_df[text_df['Model'] == model].sort_values('Chunk')
+            model_df = text_model_groups[(text, model)].sort_values('Chunk')
             ax.plot(model_df['Chunk'], model_df['TQS'], 
                    marker='o', linewidth=2.5, markersize=9,
                    label=MODEL_NAMES[model], color=MODEL_COLORS[model],
@@ -298,32 +365,34 @@ def create_tqs_lineplot(data, filename):
         ax.legend(loc='lower left', framealpha=0.9, fontsize=10)
     
     fig.suptitle('TQS Performance Across Text Chunks', fontsize=15, fontweight='bold', y=1.02)
-    plt.tight_layout()
-    plt.savefig(filename, bbox_inches='tight', dpi=300, facecolor='white')
-    plt.close()
-    print(f"Saved: {filename}")
-
-create_tqs_lineplot(df, 'charts/chart3_tqs_lineplot.png')
+    fig.tight_layout()
+    fig.savefig(filename, bbox_inches='tight', dpi=CHART_DPI, facecolor='white')
 
 # ============================================================================
 # CHART 4: Error Breakdown by Model
 # ============================================================================
 
 def create_error_chart(data, filename):
-    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    fig = Figure(figsize=(14, 6))
+    axes = fig.subplots(1, 2)
+    
+    error_cols = ['Neutral', 'Minor', 'Major', 'Critical']
+    cat_cols = ['Term_Total', 'Acc_Total']
+    models = ['claude', 'gemini', 'openai']
+    
+    # Per-model error totals for both panels in one grouped sum
+    totals = data.groupby('Model', observed=True)[error_cols + cat_cols].sum().reindex(models)
     
     # Chart 1: Error severity (stacked bar)
     ax1 = axes[0]
-    error_cols = ['Neutral', 'Minor', 'Major', 'Critical']
     error_colors = ['#90be6d', '#f9c74f', '#f8961e', '#d62828']
     
-    models = ['claude', 'gemini', 'openai']
     x = np.arange(len(models))
     width = 0.6
     
     bottom = np.zeros(len(models))
     for col, color in zip(error_cols, error_colors):
-        values = np.array([data[data['Model'] == m][col].sum() for m in models])
+        values = totals[col].to_numpy()
         ax1.bar(x, values, width, label=col, color=color, bottom=bottom, edgecolor='white', linewidth=1)
         bottom += values
     
@@ -334,19 +403,17 @@ def create_error_chart(data, filename):
     ax1.legend(loc='upper right', framealpha=0.9)
     
     # Add total annotations
-    for i, m in enumerate(models):
-        total = sum(data[data['Model'] == m][col].sum() for col in error_cols)
+    for i, total in enumerate(totals[error_cols].sum(axis=1)):
         ax1.annotate(f'Total: {int(total)}', xy=(i, total + 2), ha='center', fontsize=10, fontweight='bold')
     
     # Chart 2: Error categories (grouped bar)
     ax2 = axes[1]
-    cat_cols = ['Term_Total', 'Acc_Total']
     cat_labels = ['Terminology', 'Accuracy']
     cat_colors = ['#457b9d', '#e63946']
     
     width = 0.35
     for i, (col, label, color) in enumerate(zip(cat_cols, cat_labels, cat_colors)):
-        values = [data[data['Model'] == m][col].sum() for m in models]
+        values = totals[col].to_numpy()
         bars = ax2.bar(x + (i - 0.5) * width, values, width, label=label, color=color, 
                       edgecolor='white', linewidth=1)
         # Add value labels
@@ -361,12 +428,40 @@ def create_error_chart(data, filename):
     ax2.legend(loc='upper right', framealpha=0.9)
     
     fig.suptitle('Error Analysis by AI Model', fontsize=15, fontweight='bold', y=1.02)
-    plt.tight_layout()
-    plt.savefig(filename, bbox_inches='tight', dpi=300, facecolor='white')
-    plt.close()
-    print(f"Saved: {filename}")
+    fig.tight_layout()
+    fig.savefig(filename, bbox_inches='tight', dpi=CHART_DPI, facecolor='white')
+
+# ============================================================================
+# RENDER CHARTS
+# ============================================================================
 
-create_error_chart(df, 'charts/chart4_error_breakdown.png')
+CHART_JOBS = [
+    (create_tqs_boxplot, model_groups, 'charts/chart1_tqs_boxplot.png'),
+    (create_tqs_heatmap, text_groups, 'charts/chart2_tqs_heatmap.png'),
+    (create_tqs_lineplot, text_model_groups, 'charts/chart3_tqs_lineplot.png'),
+    (create_error_chart, df, 'charts/chart4_error_breakdown.png'),
+]
+
+def render_chart(job):
+    chart_fn, data, filename = job
+    chart_fn(data, filename)
+    return filename
+
+# The charts are independent and CPU-bound (rendering and PNG compression), so
+# they are drawn in parallel worker processes. Forked workers inherit this
+# module's state. Only Linux forks safely with numpy/matplotlib loaded (macOS
+# lists fork but it can crash or hang there, Windows lacks it), so elsewhere,
+# and on a single core, they are drawn one after another.
+chart_workers = min(len(CHART_JOBS), os.cpu_count() or 1)
+if chart_workers > 1 and sys.platform.startswith('linux'):
+    with ProcessPoolExecutor(max_workers=chart_workers,
+                             mp_context=multiprocessing.get_context('fork')) as executor:
+        rendered = list(executor.map(render_chart, CHART_JOBS))
+else:
+    rendered = [render_chart(job) for job in CHART_JOBS]
+
+for filename in rendered:
+    print(f"Saved: {filename}")
 
 # ============================================================================
 # STATISTICAL COMPARISONS
@@ -378,31 +473,32 @@ print("=" * 80)
 
 models = ['claude', 'gemini', 'openai']
 
+# TQS scores of each model, extracted once for the t-tests, the ANOVA and the report
+groups = {m: model_groups[m]['TQS'].to_numpy() for m in models}
+
+# Pairwise t-tests, computed once: (t-statistic, p-value, mean difference) per model pair
+pairwise_tests = {}
+for m1, m2 in combinations(models, 2):
+    t_stat, p_val = stats.ttest_ind(groups[m1], groups[m2])
+    pairwise_tests[(m1, m2)] = (t_stat, p_val, groups[m1].mean() - groups[m2].mean())
+
 print("\nPairwise t-tests on TQS scores:")
 print("-" * 50)
 
-for i, m1 in enumerate(models):
-    for m2 in models[i+1:]:
-        scores1 = df[df['Model'] == m1]['TQS']
-        scores2 = df[df['Model'] == m2]['TQS']
-        
-        t_stat, p_val = stats.ttest_ind(scores1, scores2)
-        
-        diff = scores1.mean() - scores2.mean()
-        winner = MODEL_NAMES[m1] if diff > 0 else MODEL_NAMES[m2]
-        
-        sig = "***" if p_val < 0.001 else "**" if p_val < 0.01 else "*" if p_val < 0.05 else ""
-        
-        print(f"\n{MODEL_NAMES[m1]} vs {MODEL_NAMES[m2]}:")
-        print(f"  Mean difference: {abs(diff):.2f} (favors {winner})")
-        print(f"  t-statistic: {t_stat:.3f}")
-        print(f"  p-value: {p_val:.4f} {sig}")
+for (m1, m2), (t_stat, p_val, diff) in pairwise_tests.items():
+    winner = MODEL_NAMES[m1] if diff > 0 else MODEL_NAMES[m2]
+    
+    sig = stars(p_val)
+    
+    print(f"\n{MODEL_NAMES[m1]} vs {MODEL_NAMES[m2]}:")
+    print(f"  Mean difference: {abs(diff):.2f} (favors {winner})")
+    print(f"  t-statistic: {t_stat:.3f}")
+    print(f"  p-value: {p_val:.4f} {sig}")
 
 # ANOVA
 print("\n" + "-" * 50)
 print("One-way ANOVA:")
-groups = [df[df['Model'] == m]['TQS'].values for m in models]
-f_stat, p_val = stats.f_oneway(*groups)
+f_stat, p_val = stats.f_oneway(*groups.values())
 print(f"  F-statistic: {f_stat:.3f}")
 print(f"  p-value: {p_val:.4f}")
 
@@ -414,21 +510,12 @@ print("\n" + "=" * 80)
 print("MODEL RANKINGS BY CHUNK")
 print("=" * 80)
 
-win_counts = {m: 0 for m in models}
-tie_counts = 0
+# A chunk with several top-TQS rows is a tie
+top_per_chunk = top_rows.groupby(chunk_keys, observed=True)['Model'].transform('size')
 
-for text in ['Comp', 'Mixtures']:
-    text_df = df[df['Text'] == text]
-    for chunk in text_df['Chunk'].unique():
-        chunk_df = text_df[text_df['Chunk'] == chunk]
-        scores = {row['Model']: row['TQS'] for _, row in chunk_df.iterrows()}
-        max_score = max(scores.values())
-        winners = [m for m, s in scores.items() if s == max_score]
-        
-        if len(winners) == 1:
-            win_counts[winners[0]] += 1
-        else:
-            tie_counts += 1
+sole_winners = top_rows.loc[top_per_chunk == 1, 'Model'].value_counts()
+win_counts = {m: int(sole_winners.get(m, 0)) for m in models}
+tie_counts = int((top_rows.groupby(chunk_keys, observed=True).size() > 1).sum())
 
 print("\nChunks where each model had highest TQS:")
 for model in sorted(win_counts, key=win_counts.get, reverse=True):
@@ -446,9 +533,7 @@ overall_std = df['TQS'].std()
 # Identify problematic chunks (TQS < 70 for any model)
 problem_chunks = []
 for text in ['Comp', 'Mixtures']:
-    text_df = df[df['Text'] == text]
-    for chunk in text_df['Chunk'].unique():
-        chunk_df = text_df[text_df['Chunk'] == chunk]
+    for chunk, chunk_df in text_groups[text].groupby('Chunk', sort=False):
         min_tqs = chunk_df['TQS'].min()
         if min_tqs < 70:
             problem_chunks.append((text, chunk, min_tqs))
@@ -509,8 +594,8 @@ report += """
 for text in ['Comp', 'Mixtures']:
     report += f"\n    {text} (De Compositione / On Mixtures):\n"
     report += "    ─────────────────────────────────────\n"
-    text_df = df[df['Text'] == text]
-    text_stats = text_df.groupby('Model')['TQS'].agg(['mean', 'std'])
+    text_df = text_groups[text]
+    text_stats = text_df.groupby('Model', observed=True)['TQS'].agg(['mean', 'std'])
     text_stats = text_stats.sort_values('mean', ascending=False)
     for model, row in text_stats.iterrows():
         bar_len = int(row['mean'] / 5)
@@ -523,24 +608,14 @@ report += """
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
-for text in ['Comp', 'Mixtures']:
+for text, text_tqs in chunk_tqs.groupby(level='Text', observed=True):
     report += f"\n    {text}:\n"
     report += "    ┌────────┬──────────┬──────────┬──────────┬────────────┐\n"
     report += "    │ Chunk  │  Claude  │  Gemini  │ ChatGPT  │   Winner   │\n"
     report += "    ├────────┼──────────┼──────────┼──────────┼────────────┤\n"
     
-    text_df = df[df['Text'] == text]
-    
-    for chunk in sorted(text_df['Chunk'].unique()):
-        chunk_df = text_df[text_df['Chunk'] == chunk]
-        scores = {row['Model']: row['TQS'] for _, row in chunk_df.iterrows()}
-        best_model = max(scores, key=scores.get)
-        
+    for (_, chunk), c_score, g_score, o_score, best_model in text_tqs.itertuples():
         # Mark low scores
-        c_score = scores.get('claude', 0)
-        g_score = scores.get('gemini', 0)
-        o_score = scores.get('openai', 0)
-        
         c_str = f"{c_score:>6.1f}{'*' if c_score < 70 else ' '}"
         g_str = f"{g_score:>6.1f}{'*' if g_score < 70 else ' '}"
         o_str = f"{o_score:>6.1f}{'*' if o_score < 70 else ' '}"
@@ -578,7 +653,7 @@ report += """
 """
 
 for model in models:
-    m_df = df[df['Model'] == model]
+    m_df = model_groups[model]
     n = m_df['Neutral'].sum()
     mi = m_df['Minor'].sum()
     ma = m_df['Major'].sum()
@@ -596,7 +671,7 @@ report += """    └─────────────┴──────
 """
 
 for model in models:
-    m_df = df[df['Model'] == model]
+    m_df = model_groups[model]
     term = m_df['Term_Total'].sum()
     acc = m_df['Acc_Total'].sum()
     report += f"    │ {MODEL_NAMES[model]:<11} │ {term:>15.0f} │ {acc:>12.0f} │\n"
@@ -610,24 +685,12 @@ report += """
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
-for i, m1 in enumerate(models):
-    for m2 in models[i+1:]:
-        scores1 = df[df['Model'] == m1]['TQS']
-        scores2 = df[df['Model'] == m2]['TQS']
-        t_stat, p_val = stats.ttest_ind(scores1, scores2)
-        diff = scores1.mean() - scores2.mean()
-        winner = MODEL_NAMES[m1] if diff > 0 else MODEL_NAMES[m2]
-        
-        if p_val < 0.001:
-            sig = "★★★ Highly significant (p < 0.001)"
-        elif p_val < 0.01:
-            sig = "★★ Very significant (p < 0.01)"
-        elif p_val < 0.05:
-            sig = "★ Significant (p < 0.05)"
-        else:
-            sig = "Not statistically significant"
-        
-        report += f"""
+for (m1, m2), (t_stat, p_val, diff) in pairwise_tests.items():
+    winner = MODEL_NAMES[m1] if diff > 0 else MODEL_NAMES[m2]
+    
+    sig = _SIG_LABEL[significance_level(p_val)]
+    
+    report += f"""
     {MODEL_NAMES[m1]} vs {MODEL_NAMES[m2]}:
     ──────────────────────────────
     • Mean difference: {abs(diff):.2f} points (favors {winner})
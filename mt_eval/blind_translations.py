@@ -10,13 +10,23 @@ Usage:
   python blind_translations.py <input_json> <output_blinded_json> [--seed 42]
 """
 
-import json
 import os
 import sys
 import random
 import argparse
+from collections import deque
 from typing import List, Dict
 
+import orjson
+
+# Per-translation fields copied into the blinded output (missing ones become '')
+BLINDED_FIELDS = ('translation', 'raw_response', 'status', 'timestamp')
+
+
+def _chunk_sort_key(chunk_id: str):
+    """Numeric chunk ids in numeric order first, then any others alphabetically."""
+    return (0, int(chunk_id)) if chunk_id.isdigit() else (1, chunk_id)
+
 
 def main():
     parser = argparse.ArgumentParser(description="Create a blinded copy of translations")
@@ -26,11 +36,11 @@ def main():
     parser.add_argument('--write_key', default=None, help='Optional path to write the key mapping JSON')
     args = parser.parse_args()
 
-    random.seed(args.seed)
+    rng = random.Random(args.seed)
 
     # Load translations
-    with open(args.input_json, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(args.input_json, 'rb') as f:
+        data = orjson.loads(f.read())
 
     # Determine models present from the first chunk
     first_chunk_id = next(iter(data.keys()))
@@ -39,36 +49,33 @@ def main():
 
     # Create a base permutation (random) then rotate per chunk index
     base_perm = models_in_data[:]
-    random.shuffle(base_perm)
+    rng.shuffle(base_perm)
 
-    # Build blinded structure: keep chunk order; for each chunk, produce ordered list of entries by permuted_models
-    blinded_output: Dict[str, List[Dict]] = {}
+    # Build blinded structure: keep chunk order; for each chunk, produce ordered list of entries by permuted_models.
+    # Chunks are streamed to disk one at a time so the full blinded output is never held in memory;
+    # the bytes match a single orjson.dumps(..., OPT_INDENT_2) of the whole dict.
     key_per_chunk: Dict[str, List[str]] = {}
-    sorted_chunk_ids = sorted(data.keys(), key=lambda x: int(x) if x.isdigit() else x)
-    for idx, chunk_id in enumerate(sorted_chunk_ids):
-        model_translations = data[chunk_id]
-        # Rotate the base permutation by idx
-        k = idx % len(base_perm)
-        order = base_perm[k:] + base_perm[:k]
-        entries: List[Dict] = []
-        for model in order:
-            if model not in model_translations:
-                continue
-            tr = model_translations[model]
+    sorted_chunk_ids = sorted(data.keys(), key=_chunk_sort_key)
+    os.makedirs(os.path.dirname(args.output_json) or '.', exist_ok=True)
+    order_dq = deque(base_perm)
+    with open(args.output_json, 'wb') as f:
+        f.write(b'{')
+        for idx, chunk_id in enumerate(sorted_chunk_ids):
+            model_translations = data[chunk_id]
+            # Base permutation rotated by idx: step the deque one position per chunk
+            order = list(order_dq)
+            order_dq.rotate(-1)
             # No labels in blinded output
-            entries.append({
-                'translation': tr.get('translation', ''),
-                'raw_response': tr.get('raw_response', ''),
-                'status': tr.get('status', ''),
-                'timestamp': tr.get('timestamp', ''),
-            })
-        blinded_output[chunk_id] = entries
-        key_per_chunk[chunk_id] = order
-
-    # Write blinded JSON
-    os.makedirs(os.path.dirname(args.output_json), exist_ok=True)
-    with open(args.output_json, 'w', encoding='utf-8') as f:
-        json.dump(blinded_output, f, ensure_ascii=False, indent=2)
+            entries: List[Dict] = [
+                {field: model_translations[model].get(field, '') for field in BLINDED_FIELDS}
+                for model in order if model in model_translations
+            ]
+            key_per_chunk[chunk_id] = order
+
+            # orjson escapes newlines inside strings, so every raw newline is structural
+            body = orjson.dumps(entries, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  ')
+            f.write((b',\n  ' if idx else b'\n  ') + orjson.dumps(chunk_id) + b': ' + body)
+        f.write(b'\n}' if sorted_chunk_ids else b'}')
 
     # Key mapping
     key_path = args.write_key
@@ -83,8 +90,9 @@ def main():
         'seed': args.seed,
         'source': os.path.abspath(args.input_json)
     }
-    with open(key_path, 'w', encoding='utf-8') as f:
-        json.dump(key_obj, f, ensure_ascii=False, indent=2)
+    os.makedirs(os.path.dirname(key_path) or '.', exist_ok=True)
+    with open(key_path, 'wb') as f:
+        f.write(orjson.dumps(key_obj, option=orjson.OPT_INDENT_2))
 
     print(f"✓ Blinded output written to: {args.output_json}")
     print(f"  Key mapping written to: {key_path}")
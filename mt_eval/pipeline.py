@@ -52,9 +52,9 @@ except ImportError:
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from parser import InputParser
-from translator import Translator
-from evaluator import Evaluator
 from reporter import Reporter
+# translator and evaluator pull in the API SDKs, numpy and pandas; they are
+# imported inside Pipeline.run so --help and argument errors return quickly
 
 logging.basicConfig(
     level=logging.INFO,
@@ -71,7 +71,11 @@ class Pipeline:
         models: list = None,
         metrics: list = None,
         use_gpu: bool = False,
-        parallel_translation: bool = False
+        parallel_translation: bool = False,
+        chunk_workers: int = 1,
+        translation_cache: str = None,
+        eval_workers: int = 1,
+        metric_cache: str = None
     ):
         """
         Initialize pipeline.
@@ -81,11 +85,19 @@ class Pipeline:
             metrics: List of evaluation metrics to use
             use_gpu: Whether to use GPU for neural metrics
             parallel_translation: Whether to translate with models in parallel
+            chunk_workers: Number of chunks translated concurrently
+            translation_cache: Optional path of an SQLite cache of translations
+            eval_workers: Worker processes for lexical evaluation metrics
+            metric_cache: Optional path of an on-disk cache for neural metric scores
         """
         self.models = models or ['openai', 'claude', 'gemini']
         self.metrics = metrics or ['bleu', 'chrf', 'meteor', 'rouge', 'bertscore', 'comet']
         self.use_gpu = use_gpu
         self.parallel_translation = parallel_translation
+        self.chunk_workers = chunk_workers
+        self.translation_cache = translation_cache
+        self.eval_workers = eval_workers
+        self.metric_cache = metric_cache
         
         self.parser = None
         self.translator = None
@@ -154,17 +166,25 @@ class Pipeline:
         print("=" * 80)
         print()
         
-        self.translator = Translator(models=self.models)
+        from translator import Translator
+        self.translator = Translator(
+            models=self.models,
+            chunk_workers=self.chunk_workers,
+            cache_path=self.translation_cache
+        )
         
         chunks_for_translation = [
             {'chunk_id': chunk.chunk_id, 'greek_text': chunk.greek_text}
             for chunk in parsed_chunks
         ]
         
-        translations = self.translator.translate_chunks(
-            chunks_for_translation,
-            parallel=self.parallel_translation
-        )
+        try:
+            translations = self.translator.translate_chunks(
+                chunks_for_translation,
+                parallel=self.parallel_translation
+            )
+        finally:
+            self.translator.close()
         
         # Save translations
         translations_file = f"{output_dir}/translations/{base_name}_translations_{timestamp}.json"
@@ -180,9 +200,18 @@ class Pipeline:
         print("=" * 80)
         print()
         
-        self.evaluator = Evaluator(metrics=self.metrics, use_gpu=self.use_gpu)
+        from evaluator import Evaluator
+        self.evaluator = Evaluator(
+            metrics=self.metrics,
+            use_gpu=self.use_gpu,
+            num_workers=self.eval_workers,
+            cache_path=self.metric_cache
+        )
         
-        evaluations = self.evaluator.evaluate_all(parsed_chunks, translations)
+        try:
+            evaluations = self.evaluator.evaluate_all(parsed_chunks, translations)
+        finally:
+            self.evaluator.close()
         
         # Save evaluations
         evaluations_file = f"{output_dir}/evaluations/{base_name}_evaluation_{timestamp}.json"
@@ -301,6 +330,32 @@ Examples:
         help='Translate with models in parallel (faster but more API load)'
     )
     
+    parser.add_argument(
+        '--chunk-workers',
+        type=int,
+        default=1,
+        help='Chunks to translate concurrently, capped per provider (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--translation-cache',
+        default=None,
+        help='Path of an SQLite cache of translations, reused across runs'
+    )
+    
+    parser.add_argument(
+        '--eval-workers',
+        type=int,
+        default=1,
+        help='Worker processes for lexical metrics (BLEU, chrF++, METEOR, ROUGE-L; default: 1)'
+    )
+    
+    parser.add_argument(
+        '--metric-cache',
+        default=None,
+        help='Path of an on-disk cache for neural metric scores, reused across runs'
+    )
+    
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -322,7 +377,11 @@ Examples:
         models=args.models,
         metrics=args.metrics,
         use_gpu=args.gpu,
-        parallel_translation=args.parallel
+        parallel_translation=args.parallel,
+        chunk_workers=args.chunk_workers,
+        translation_cache=args.translation_cache,
+        eval_workers=args.eval_workers,
+        metric_cache=args.metric_cache
     )
     
     try:
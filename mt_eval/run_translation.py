@@ -16,7 +16,14 @@ load_dotenv(env_path)
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from translator import Translator
+from parser import CHUNK_MARKER_PATTERN
+from translator import Translator, summarize_translations
+
+# Any Greek letter (basic + polytonic ranges); compiled once for all chunks
+_GREEK_RE = re.compile(r'[α-ωΑ-Ωἀ-ἇἰ-ἷὀ-὇ὐ-ὗὠ-ὧᾀ-ᾇᾐ-ᾗᾠ-ᾧᾰ-ᾱῐ-ῑῠ-ῡ]')
+# Blank-line paragraph breaks and whitespace runs
+_PARA_RE = re.compile(r'\n\s*\n')
+_WS_RE = re.compile(r'\s+')
 
 
 def extract_greek_chunks(file_path):
@@ -24,34 +31,25 @@ def extract_greek_chunks(file_path):
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
     
-    # Split by "Chunk N" markers
-    chunk_pattern = r'(?:^|\n)Chunk\s+(\d+)\s*\n'
-    parts = re.split(chunk_pattern, content, flags=re.MULTILINE)
+    # Walk the "Chunk N" markers; each chunk's content runs to the next marker
+    markers = list(CHUNK_MARKER_PATTERN.finditer(content))
     
     chunks = []
-    i = 1
-    while i < len(parts) - 1:
-        chunk_number = parts[i]
-        chunk_content = parts[i + 1]
-        
-        # Split into paragraphs
-        paragraphs = re.split(r'\n\s*\n', chunk_content)
-        paragraphs = [p.strip() for p in paragraphs if p.strip()]
+    for idx, marker in enumerate(markers):
+        end = markers[idx + 1].start() if idx + 1 < len(markers) else len(content)
+        chunk_number = marker.group(1)
+        chunk_content = content[marker.end():end]
         
         # Find Greek paragraph (contains Greek characters)
-        greek_pattern = re.compile(r'[α-ωΑ-Ωἀ-ἇἰ-ἷὀ-὇ὐ-ὗὠ-ὧᾀ-ᾇᾐ-ᾗᾠ-ᾧᾰ-ᾱῐ-ῑῠ-ῡ]+')
-        
-        for para in paragraphs:
-            para_clean = re.sub(r'\s+', ' ', para).strip()
-            if greek_pattern.search(para_clean):
+        for para in _PARA_RE.split(chunk_content):
+            para_clean = _WS_RE.sub(' ', para).strip()
+            if para_clean and _GREEK_RE.search(para_clean):
                 chunks.append({
                     'chunk_id': chunk_number,
                     'greek_text': para_clean
                 })
                 print(f"✓ Extracted Chunk {chunk_number}: {len(para_clean)} chars")
                 break
-        
-        i += 2
     
     return chunks
 
@@ -79,7 +77,10 @@ def main():
     translator = Translator(models=['openai', 'claude', 'gemini'])
     
     print("\nStarting translation...")
-    translations = translator.translate_chunks(chunks, parallel=True)
+    try:
+        translations = translator.translate_chunks(chunks, parallel=True)
+    finally:
+        translator.close()
     
     # Save
     if output_file:
@@ -92,16 +93,11 @@ def main():
         translator.save_translations(translations, output_file)
     
     # Summary
-    total_chunks = len(translations)
-    successful = sum(
-        1 for chunk_translations in translations.values()
-        for translation in chunk_translations.values()
-        if translation.status == 'success'
-    )
-    total_attempts = sum(len(chunk_translations) for chunk_translations in translations.values())
+    summary = summarize_translations(translations)
+    successful, total_attempts = summary['successful'], summary['attempts']
     
     print(f"\n✓ Translation complete!")
-    print(f"  Chunks: {total_chunks}")
+    print(f"  Chunks: {summary['chunks']}")
     print(f"  Success rate: {successful}/{total_attempts} ({100*successful/total_attempts:.1f}%)")
     print(f"  Output: {output_file}")
 
@@ -8,14 +8,14 @@ Tables:
 3. Reference Translation Effects (Appendix)
 """
 
-import json
+import orjson
 import numpy as np
 from pathlib import Path
 from datetime import datetime
 
 def load_evaluation(filepath):
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        return orjson.loads(f.read())
 
 def format_mean_sd(mean, std, scale=100, decimals=1):
     """Format as 'mean (± std)' with optional scaling."""
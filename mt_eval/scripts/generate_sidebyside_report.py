@@ -9,15 +9,15 @@ Generate a detailed side-by-side report showing:
 For validation and transparency purposes.
 """
 
-import json
+import orjson
 import os
 import re
 from pathlib import Path
 from datetime import datetime
 
 def load_json(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        return orjson.loads(f.read())
 
 def parse_input_file(filepath):
     """Parse input file to extract chunks with Greek and references."""
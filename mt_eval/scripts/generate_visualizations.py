@@ -4,7 +4,7 @@ Generate visualizations for translation evaluation results.
 Creates bar charts, heatmaps, and comparison tables.
 """
 
-import json
+import orjson
 import os
 import matplotlib.pyplot as plt
 import numpy as np
@@ -16,8 +16,8 @@ plt.rcParams['font.family'] = 'DejaVu Sans'
 plt.rcParams['font.size'] = 11
 
 def load_evaluation(filepath):
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        return orjson.loads(f.read())
 
 def plot_model_comparison(data, title, output_path):
     """Bar chart comparing models across all metrics."""
@@ -17,15 +17,68 @@ Multi-reference methodology:
 """
 
 import logging
-import json
 import os
+import hashlib
+import shelve
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, asdict, field
 import numpy as np
+import orjson
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# CPU-only metrics that can be scored in worker processes; neural metrics
+# (BERTScore, COMET, BLEURT) always stay in the main process with their models
+LEXICAL_METRICS = ('bleu', 'chrf', 'meteor', 'rouge')
+
+
+# NLTK resources used by METEOR: (path for nltk.data.find, package to download).
+# punkt_tab is the tokenizer table word_tokenize loads on NLTK >= 3.8.2
+NLTK_RESOURCES = (
+    ('corpora/wordnet', 'wordnet'),
+    ('corpora/omw-1.4', 'omw-1.4'),
+    ('tokenizers/punkt_tab', 'punkt_tab'),
+)
+
+
+def _ensure_nltk_data():
+    """Download NLTK resources only when they are not installed yet."""
+    import nltk
+    for path, package in NLTK_RESOURCES:
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            nltk.download(package, quiet=True)
+
+
+class _CachingTokenizer:
+    """
+    Memoizing wrapper for a rouge_score tokenizer.
+    
+    Porter-stemming dominates ROUGE-L time, and each reference is re-scored
+    against every model and again in the per-reference breakdown.
+    """
+    
+    def __init__(self, tokenizer):
+        self._tokenize = lru_cache(maxsize=8192)(tokenizer.tokenize)
+    
+    def tokenize(self, text: str) -> List[str]:
+        return self._tokenize(text)
+
+
+@lru_cache(maxsize=8192)
+def _tokenize(text: str) -> Tuple[str, ...]:
+    """
+    Lowercase and word-tokenize text for METEOR.
+    
+    Cached: each reference is shared by every model and reused for the
+    per-reference breakdown, and each hypothesis is scored 1 + N times.
+    """
+    from nltk.tokenize import word_tokenize
+    return tuple(word_tokenize(text.lower()))
+
 
 @dataclass
 class EvaluationScore:
@@ -60,7 +113,15 @@ class ChunkEvaluation:
 class Evaluator:
     """Evaluate translations using multiple metrics."""
     
-    def __init__(self, metrics: List[str] = None, use_gpu: bool = False):
+    def __init__(
+        self,
+        metrics: List[str] = None,
+        use_gpu: bool = False,
+        num_workers: int = 1,
+        cache_path: Optional[str] = None,
+        batch_size: int = 64,
+        fp16: bool = False
+    ):
         """
         Initialize evaluator with specified metrics.
         
@@ -69,6 +130,13 @@ class Evaluator:
                     ['bleu', 'chrf', 'meteor', 'rouge', 'bertscore', 'comet', 'bleurt']
                     If None, uses all available metrics
             use_gpu: Whether to use GPU for neural metrics
+            num_workers: Worker processes for lexical metrics in evaluate_all (1 = serial)
+            cache_path: Optional on-disk cache (shelve) for neural metric scores,
+                    keyed by a hash of the metric, its scorer configuration and the input texts
+            batch_size: Mini-batch size for neural metrics. BERTScore and COMET sort
+                    inputs by length before batching, so larger batches pad little;
+                    lower it if GPU memory runs out on long passages
+            fp16: Run BERTScore in half precision (GPU only); F1 shifts by ~1e-3
         """
         if metrics is None:
             # Note: BLEURT excluded by default due to TensorFlow threading issues on macOS
@@ -77,7 +145,23 @@ class Evaluator:
         
         self.metrics = metrics
         self.use_gpu = use_gpu
+        self.num_workers = num_workers
+        self.batch_size = batch_size
+        self.fp16 = fp16
         self.metric_handlers = {}
+        # Lexical scores precomputed by the worker pool, keyed by (hypothesis, references)
+        self._lexical_precomputed = {}
+        # Neural per-pair scores precomputed in batches: {metric: {pair: score}}
+        self._pair_precomputed = {}
+        # Scorer model and precision per neural metric, part of the metric cache key
+        self._metric_configs = {}
+        self._cache = None
+        if cache_path:
+            cache_dir = os.path.dirname(cache_path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            self._cache = shelve.open(cache_path)
+            logger.info(f"Metric cache: {cache_path} ({len(self._cache)} entries)")
         self._setup_metrics()
     
     def _setup_metrics(self):
@@ -106,10 +190,8 @@ class Evaluator:
         # METEOR
         if 'meteor' in self.metrics:
             try:
-                import nltk
                 from nltk.translate.meteor_score import meteor_score
-                nltk.download('wordnet', quiet=True)
-                nltk.download('omw-1.4', quiet=True)
+                _ensure_nltk_data()
                 self.metric_handlers['meteor'] = meteor_score
                 logger.info("✓ METEOR metric available")
             except ImportError:
@@ -120,11 +202,11 @@ class Evaluator:
         # ROUGE (ROUGE-L only)
         if 'rouge' in self.metrics:
             try:
-                from rouge_score import rouge_scorer
+                from rouge_score import rouge_scorer, tokenizers
                 # Only ROUGE-L as per colleague's recommendation
                 self.metric_handlers['rouge'] = rouge_scorer.RougeScorer(
                     ['rougeL'],
-                    use_stemmer=True
+                    tokenizer=_CachingTokenizer(tokenizers.DefaultTokenizer(use_stemmer=True))
                 )
                 logger.info("✓ ROUGE-L metric available")
             except ImportError:
@@ -133,8 +215,19 @@ class Evaluator:
         # BERTScore
         if 'bertscore' in self.metrics:
             try:
-                import bert_score
-                self.metric_handlers['bertscore'] = bert_score
+                from bert_score import BERTScorer
+                # Load the model once; bert_score.score() would reload it on every call
+                self.metric_handlers['bertscore'] = BERTScorer(
+                    lang='en',
+                    device='cuda' if self.use_gpu else 'cpu'
+                )
+                half = self.use_gpu and self.fp16
+                if half:
+                    # Inference only: half precision roughly doubles throughput on tensor cores
+                    self.metric_handlers['bertscore']._model.half()
+                self._metric_configs['bertscore'] = (
+                    f"{self.metric_handlers['bertscore'].model_type}/{'fp16' if half else 'fp32'}"
+                )
                 logger.info("✓ BERTScore available")
             except ImportError:
                 logger.warning("bert-score not available")
@@ -145,6 +238,7 @@ class Evaluator:
                 from bleurt import score as bleurt_score
                 checkpoint = os.getenv('BLEURT_CHECKPOINT', 'bleurt-20')
                 self.metric_handlers['bleurt'] = bleurt_score.BleurtScorer(checkpoint)
+                self._metric_configs['bleurt'] = checkpoint
                 logger.info("✓ BLEURT available")
             except ImportError:
                 logger.warning("BLEURT not available (pip install bleurt)")
@@ -158,6 +252,7 @@ class Evaluator:
                 # Use the default COMET model for translation quality estimation
                 model_path = download_model("Unbabel/wmt22-comet-da")
                 self.metric_handlers['comet'] = load_from_checkpoint(model_path)
+                self._metric_configs['comet'] = "Unbabel/wmt22-comet-da"
                 if self.use_gpu:
                     self.metric_handlers['comet'] = self.metric_handlers['comet'].cuda()
                 logger.info("✓ COMET available")
@@ -287,12 +382,11 @@ class Evaluator:
             return []
         
         try:
-            from nltk.tokenize import word_tokenize
             meteor_score_func = self.metric_handlers['meteor']
             
-            hyp_tokens = word_tokenize(hypothesis.lower())
+            hyp_tokens = list(_tokenize(hypothesis))
             # Tokenize all references - METEOR accepts list of reference token lists
-            ref_tokens_list = [word_tokenize(ref.lower()) for ref in references]
+            ref_tokens_list = [list(_tokenize(ref)) for ref in references]
             
             # METEOR natively handles multiple references and takes the max
             score = meteor_score_func(ref_tokens_list, hyp_tokens)
@@ -317,27 +411,17 @@ class Evaluator:
             return []
         
         try:
-            bert_score_module = self.metric_handlers['bertscore']
+            # (P, R, F1) against every reference, scored in a single batch
+            results = self._pair_scores(
+                'bertscore',
+                [(hypothesis, reference) for reference in references],
+                self._bertscore_batch
+            )
             
-            # Compute against each reference
-            best_f1 = -1
-            best_result = None
-            best_ref_idx = 0
-            
-            for ref_idx, reference in enumerate(references):
-                P, R, F1 = bert_score_module.score(
-                    [hypothesis], 
-                    [reference], 
-                    lang='en',
-                    verbose=False,
-                    device='cuda' if self.use_gpu else 'cpu'
-                )
-                
-                f1_val = float(F1[0])
-                if f1_val > best_f1:
-                    best_f1 = f1_val
-                    best_result = (float(P[0]), float(R[0]), f1_val)
-                    best_ref_idx = ref_idx + 1
+            # Take the reference with the best F1
+            best_idx = max(range(len(results)), key=lambda i: results[i][2])
+            best_result = results[best_idx]
+            best_ref_idx = best_idx + 1
             
             return [EvaluationScore(
                 metric_name='BERTScore',
@@ -366,17 +450,15 @@ class Evaluator:
             return []
         
         try:
-            scorer = self.metric_handlers['bleurt']
-            
-            # Compute against each reference, take max
-            best_score = -float('inf')
-            best_ref_idx = 0
-            
-            for ref_idx, reference in enumerate(references):
-                scores = scorer.score(references=[reference], candidates=[hypothesis])
-                if scores[0] > best_score:
-                    best_score = scores[0]
-                    best_ref_idx = ref_idx + 1
+            # Score against every reference in one batched call, take max
+            scores = self._pair_scores(
+                'bleurt',
+                [(hypothesis, reference) for reference in references],
+                self._bleurt_batch
+            )
+            best_idx = int(np.argmax(scores))
+            best_score = scores[best_idx]
+            best_ref_idx = best_idx + 1
             
             return [EvaluationScore(
                 metric_name='BLEURT',
@@ -403,39 +485,15 @@ class Evaluator:
             return []
         
         try:
-            model = self.metric_handlers['comet']
-            
-            # Use simpler prediction without multiprocessing
-            import os
-            import torch
-            os.environ['TOKENIZERS_PARALLELISM'] = 'false'
-            
-            # Fix for MPS (Mac M1/M2) - requires num_workers > 0 when multiprocessing_context is set
-            num_workers = 1 if torch.backends.mps.is_available() else 0
-            
-            # Compute against each reference, take max
-            best_score = -float('inf')
-            best_ref_idx = 0
-            
-            for ref_idx, reference in enumerate(references):
-                data = [{
-                    'src': source,
-                    'mt': hypothesis,
-                    'ref': reference
-                }]
-                
-                output = model.predict(
-                    data, 
-                    batch_size=1, 
-                    gpus=(1 if self.use_gpu else 0),
-                    num_workers=num_workers,
-                    progress_bar=False
-                )
-                
-                score = float(output['scores'][0])
-                if score > best_score:
-                    best_score = score
-                    best_ref_idx = ref_idx + 1
+            # Score against every reference in a single predict() call, take max
+            scores = self._pair_scores(
+                'comet',
+                [(source, hypothesis, reference) for reference in references],
+                self._comet_batch
+            )
+            best_idx = int(np.argmax(scores))
+            best_score = scores[best_idx]
+            best_ref_idx = best_idx + 1
             
             return [EvaluationScore(
                 metric_name='COMET',
@@ -451,6 +509,211 @@ class Evaluator:
             logger.warning(f"COMET calculation failed: {e}")
             return []
     
+    def _bertscore_batch(self, pairs: List[Tuple[str, str]]) -> List[Tuple[float, float, float]]:
+        """BERTScore (P, R, F1) for a list of (hypothesis, reference) pairs in one call."""
+        import torch
+        
+        # Inference only: skip autograd bookkeeping (bert_score only uses no_grad)
+        with torch.inference_mode():
+            P, R, F1 = self.metric_handlers['bertscore'].score(
+                [hyp for hyp, _ in pairs],
+                [ref for _, ref in pairs],
+                verbose=False,
+                batch_size=self.batch_size
+            )
+        return list(zip(P.tolist(), R.tolist(), F1.tolist()))
+    
+    def _bleurt_batch(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        """BLEURT scores for a list of (hypothesis, reference) pairs in one call."""
+        scores = self.metric_handlers['bleurt'].score(
+            references=[ref for _, ref in pairs],
+            candidates=[hyp for hyp, _ in pairs],
+            batch_size=self.batch_size
+        )
+        return [float(score) for score in scores]
+    
+    def _comet_batch(self, triples: List[Tuple[str, str, str]]) -> List[float]:
+        """COMET scores for a list of (source, hypothesis, reference) triples in one predict() call."""
+        model = self.metric_handlers['comet']
+        
+        # Use simpler prediction without multiprocessing
+        import torch
+        os.environ['TOKENIZERS_PARALLELISM'] = 'false'
+        
+        # Fix for MPS (Mac M1/M2) - requires num_workers > 0 when multiprocessing_context is set
+        num_workers = 1 if torch.backends.mps.is_available() else 0
+        
+        data = [{'src': src, 'mt': hyp, 'ref': ref} for src, hyp, ref in triples]
+        output = model.predict(
+            data,
+            batch_size=min(len(data), self.batch_size),
+            gpus=(1 if self.use_gpu else 0),
+            num_workers=num_workers,
+            progress_bar=False
+        )
+        return [float(score) for score in output['scores']]
+    
+    def _pair_scores(self, metric: str, pairs: List[Tuple], compute) -> List:
+        """
+        Per-pair scores for a neural metric.
+        
+        Served from the table filled by _precompute_neural when every pair is
+        there; otherwise computed directly with one batched call.
+        """
+        table = self._pair_precomputed.get(metric)
+        if table is not None and all(pair in table for pair in pairs):
+            return [table[pair] for pair in pairs]
+        return compute(pairs)
+    
+    def _precompute_neural(self, jobs: List[Tuple[str, List[str], str]]):
+        """
+        Score every (hypothesis, reference) pair needed by the neural metrics in
+        one batched call per metric, instead of a small call per hypothesis.
+        
+        Jobs whose scores are already in the metric cache are skipped.
+        """
+        pair_metrics = {
+            'bertscore': self._bertscore_batch,
+            'bleurt': self._bleurt_batch,
+            'comet': self._comet_batch,
+        }
+        
+        for metric, compute in pair_metrics.items():
+            if metric not in self.metric_handlers:
+                continue
+            
+            pairs = {}
+            for hypothesis, references, source in jobs:
+                if metric == 'comet' and not source:
+                    continue
+                if self._is_cached(metric, hypothesis, references, source):
+                    continue
+                for reference in references:
+                    pair = (source, hypothesis, reference) if metric == 'comet' else (hypothesis, reference)
+                    pairs[pair] = None
+            
+            if not pairs:
+                continue
+            
+            unique_pairs = list(pairs)
+            logger.info(f"Scoring {len(unique_pairs)} pairs for {metric} in one batch...")
+            try:
+                self._pair_precomputed[metric] = dict(zip(unique_pairs, compute(unique_pairs)))
+            except Exception as e:
+                # Fall back to per-hypothesis scoring, which logs its own failures
+                logger.warning(f"Batched {metric} scoring failed: {e}")
+    
+    def evaluate_lexical(self, hypothesis: str, references: List[str]) -> List[EvaluationScore]:
+        """
+        Calculate the lexical metrics (BLEU-4, chrF++, METEOR, ROUGE-L).
+        
+        Returns scores precomputed by the worker pool when available.
+        """
+        precomputed = self._lexical_precomputed.get((hypothesis, tuple(references)))
+        if precomputed is not None:
+            return precomputed
+        
+        scores = []
+        scores.extend(self.evaluate_bleu(hypothesis, references))
+        scores.extend(self.evaluate_chrf(hypothesis, references))
+        scores.extend(self.evaluate_meteor(hypothesis, references))
+        scores.extend(self.evaluate_rouge(hypothesis, references))
+        return scores
+    
+    def _precompute_lexical(self, jobs: List[Tuple[str, List[str]]]):
+        """
+        Score lexical metrics for all (hypothesis, references) jobs across worker processes.
+        
+        Results are looked up by evaluate_lexical; neural metrics are unaffected.
+        """
+        lexical_metrics = [m for m in LEXICAL_METRICS if m in self.metric_handlers]
+        if self.num_workers <= 1 or not lexical_metrics or not jobs:
+            return
+        
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        
+        unique_jobs = list(dict.fromkeys((hyp, tuple(refs)) for hyp, refs in jobs))
+        logger.info(f"Scoring lexical metrics for {len(unique_jobs)} pairs with {self.num_workers} workers...")
+        
+        # Spawned, not forked: this runs on a helper thread while torch/COMET
+        # inference (and its thread pools) is live on the main thread, and
+        # forking a multithreaded process can deadlock. Workers build their own
+        # handlers in _init_lexical_worker, so they need no inherited state.
+        with ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_lexical_worker,
+            initargs=(lexical_metrics,)
+        ) as executor:
+            chunksize = max(1, len(unique_jobs) // (self.num_workers * 4))
+            results = executor.map(_score_lexical, unique_jobs, chunksize=chunksize)
+            self._lexical_precomputed = dict(zip(unique_jobs, results))
+    
+    def _cache_key(self, metric: str, *texts: str) -> str:
+        """
+        Content hash identifying a metric computation.
+        
+        Includes the scorer's model and precision, so e.g. fp16 BERTScore
+        results are never served to an fp32 run or vice versa.
+        """
+        parts = (metric, self._metric_configs.get(metric, '')) + texts
+        return hashlib.blake2b('\0'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _is_cached(self, metric: str, hypothesis: str, references: List[str], source: str = None) -> bool:
+        """Whether evaluate_neural would serve this metric from the cache."""
+        if self._cache is None:
+            return False
+        texts = (hypothesis, '\0'.join(references))
+        if metric == 'comet':
+            texts += (source,)
+        return self._cache_key(metric, *texts) in self._cache
+    
+    def _cached_scores(self, metric: str, compute, *texts: str) -> List[EvaluationScore]:
+        """
+        Return cached scores for (metric, texts), computing and storing them on a miss.
+        
+        Failed calculations (empty results) are not cached so they are retried next run.
+        """
+        if self._cache is None:
+            return compute()
+        
+        key = self._cache_key(metric, *texts)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return [EvaluationScore(**score) for score in cached]
+        
+        scores = compute()
+        if scores:
+            self._cache[key] = [asdict(score) for score in scores]
+        return scores
+    
+    def evaluate_neural(self, hypothesis: str, references: List[str], source: str = None) -> List[EvaluationScore]:
+        """
+        Calculate the neural metrics (BERTScore, BLEURT, and COMET when source is given).
+        
+        Scores are served from the metric cache when one is configured.
+        """
+        refs_key = '\0'.join(references)
+        scores = []
+        scores.extend(self._cached_scores(
+            'bertscore', lambda: self.evaluate_bertscore(hypothesis, references), hypothesis, refs_key))
+        scores.extend(self._cached_scores(
+            'bleurt', lambda: self.evaluate_bleurt(hypothesis, references), hypothesis, refs_key))
+        
+        if source:
+            scores.extend(self._cached_scores(
+                'comet', lambda: self.evaluate_comet(hypothesis, references, source),
+                hypothesis, refs_key, source))
+        
+        return scores
+    
+    def close(self):
+        """Flush and close the metric cache, if any."""
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+    
     def evaluate_single(self, hypothesis: str, references: List[str], source: str = None) -> List[EvaluationScore]:
         """
         Evaluate a single hypothesis against multiple references.
@@ -466,17 +729,10 @@ class Evaluator:
         all_scores = []
         
         # Lexical metrics
-        all_scores.extend(self.evaluate_bleu(hypothesis, references))
-        all_scores.extend(self.evaluate_chrf(hypothesis, references))
-        all_scores.extend(self.evaluate_meteor(hypothesis, references))
-        all_scores.extend(self.evaluate_rouge(hypothesis, references))
+        all_scores.extend(self.evaluate_lexical(hypothesis, references))
         
         # Neural/semantic metrics
-        all_scores.extend(self.evaluate_bertscore(hypothesis, references))
-        all_scores.extend(self.evaluate_bleurt(hypothesis, references))
-        
-        if source:
-            all_scores.extend(self.evaluate_comet(hypothesis, references, source))
+        all_scores.extend(self.evaluate_neural(hypothesis, references, source))
         
         return all_scores
     
@@ -502,15 +758,8 @@ class Evaluator:
             scores = []
             
             # Evaluate against this single reference
-            scores.extend(self.evaluate_bleu(hypothesis, [reference]))
-            scores.extend(self.evaluate_chrf(hypothesis, [reference]))
-            scores.extend(self.evaluate_meteor(hypothesis, [reference]))
-            scores.extend(self.evaluate_rouge(hypothesis, [reference]))
-            scores.extend(self.evaluate_bertscore(hypothesis, [reference]))
-            scores.extend(self.evaluate_bleurt(hypothesis, [reference]))
-            
-            if source:
-                scores.extend(self.evaluate_comet(hypothesis, [reference], source))
+            scores.extend(self.evaluate_lexical(hypothesis, [reference]))
+            scores.extend(self.evaluate_neural(hypothesis, [reference], source))
             
             per_ref_scores[ref_id] = scores
         
@@ -583,6 +832,9 @@ class Evaluator:
         """
         all_evaluations = []
         
+        # Collect each chunk's model translations first so the lexical metrics
+        # can be farmed out to worker processes in one go
+        chunk_jobs = []
         for chunk in parsed_chunks:
             chunk_id = chunk.chunk_id
             
@@ -600,15 +852,48 @@ class Evaluator:
                 else:
                     model_translations[model] = str(trans_obj)
             
-            # Evaluate
-            chunk_evaluations = self.evaluate_chunk(
-                chunk_id=chunk_id,
-                source_text=chunk.greek_text,
-                model_translations=model_translations,
-                reference_translations=chunk.reference_translations
-            )
+            chunk_jobs.append((chunk, model_translations))
+        
+        # Every (hypothesis, references, source) the metrics will see: the
+        # multi-reference score plus one per-reference score per reference
+        metric_jobs = []
+        for chunk, model_translations in chunk_jobs:
+            references = chunk.reference_translations
+            for translation in model_translations.values():
+                if not translation or translation.strip() == '':
+                    continue
+                metric_jobs.append((translation, references, chunk.greek_text))
+                metric_jobs.extend((translation, [reference], chunk.greek_text) for reference in references)
+        
+        if self.num_workers > 1:
+            # The lexical worker processes and the (GPU-bound) neural batches
+            # are independent, so drive the process pool from a helper thread
+            # while the neural metrics run on this one
+            from concurrent.futures import ThreadPoolExecutor
             
-            all_evaluations.extend(chunk_evaluations)
+            with ThreadPoolExecutor(max_workers=1) as lexical_thread:
+                lexical_done = lexical_thread.submit(
+                    self._precompute_lexical, [(hyp, refs) for hyp, refs, _ in metric_jobs]
+                )
+                self._precompute_neural(metric_jobs)
+                lexical_done.result()
+        else:
+            self._precompute_neural(metric_jobs)
+        
+        try:
+            for chunk, model_translations in chunk_jobs:
+                # Evaluate
+                chunk_evaluations = self.evaluate_chunk(
+                    chunk_id=chunk.chunk_id,
+                    source_text=chunk.greek_text,
+                    model_translations=model_translations,
+                    reference_translations=chunk.reference_translations
+                )
+                
+                all_evaluations.extend(chunk_evaluations)
+        finally:
+            self._lexical_precomputed = {}
+            self._pair_precomputed = {}
         
         logger.info(f"Completed {len(all_evaluations)} evaluations")
         return all_evaluations
@@ -624,26 +909,23 @@ class Evaluator:
             - Statistical summaries
             - Per-reference breakdown (for detailed analysis)
         """
-        from collections import defaultdict
-        
-        # Organize scores by model and metric
-        scores_by_model_metric = defaultdict(lambda: defaultdict(list))
-        
-        # Also collect per-reference scores for detailed analysis
-        per_ref_by_model_metric = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+        # pandas is only needed here; importing it lazily keeps CLI startup light
+        import pandas as pd
         
-        for eval in evaluations:
-            model = eval.model_name
-            
-            # Primary multi-reference scores
-            for score in eval.scores:
-                metric = score.metric_name
-                scores_by_model_metric[model][metric].append(score.score)
-            
-            # Per-reference breakdown (for detailed analysis)
-            for ref_id, ref_scores in eval.per_reference_scores.items():
-                for metric, score_val in ref_scores.items():
-                    per_ref_by_model_metric[model][metric][ref_id].append(score_val)
+        # One long-format table per granularity; groupby(sort=False) keeps
+        # models/metrics in first-seen order, as the report and JSON expect
+        scores_df = pd.DataFrame(
+            [(eval.model_name, score.metric_name, score.score)
+             for eval in evaluations for score in eval.scores],
+            columns=['model', 'metric', 'score']
+        )
+        per_ref_df = pd.DataFrame(
+            [(eval.model_name, metric, ref_id, score_val)
+             for eval in evaluations
+             for ref_id, ref_scores in eval.per_reference_scores.items()
+             for metric, score_val in ref_scores.items()],
+            columns=['model', 'metric', 'ref_id', 'score']
+        )
         
         # Calculate aggregates
         summary = {
@@ -664,24 +946,21 @@ class Evaluator:
             'detailed_scores': []
         }
         
-        # Per-model statistics
-        model_averages = {}
-        for model in scores_by_model_metric:
-            summary['by_model'][model] = {}
-            all_model_scores = []
-            
-            for metric in scores_by_model_metric[model]:
-                scores = scores_by_model_metric[model][metric]
-                summary['by_model'][model][metric] = {
-                    'mean': float(np.mean(scores)),
-                    'std': float(np.std(scores)),
-                    'min': float(np.min(scores)),
-                    'max': float(np.max(scores)),
-                    'count': len(scores)
-                }
-                all_model_scores.extend(scores)
-            
-            model_averages[model] = np.mean(all_model_scores) if all_model_scores else 0.0
+        # Per-model statistics (population std, matching np.std)
+        grouped = scores_df.groupby(['model', 'metric'], sort=False)['score']
+        stats = grouped.agg(['mean', 'min', 'max', 'count'])
+        stats['std'] = grouped.std(ddof=0)
+        
+        for (model, metric), row in stats.iterrows():
+            summary['by_model'].setdefault(model, {})[metric] = {
+                'mean': float(row['mean']),
+                'std': float(row['std']),
+                'min': float(row['min']),
+                'max': float(row['max']),
+                'count': int(row['count'])
+            }
+        
+        model_averages = scores_df.groupby('model', sort=False)['score'].mean()
         
         # Overall rankings
         summary['overall_rankings'] = sorted(
@@ -690,41 +969,34 @@ class Evaluator:
             reverse=True
         )
         
-        # Per-metric best models
-        for model in scores_by_model_metric:
-            for metric in scores_by_model_metric[model]:
-                if metric not in summary['by_metric']:
-                    summary['by_metric'][metric] = {}
-                
-                scores = scores_by_model_metric[model][metric]
-                summary['by_metric'][metric][model] = float(np.mean(scores))
-        
-        # Best model per metric
-        for metric in summary['by_metric']:
-            model_scores = {k: v for k, v in summary['by_metric'][metric].items() if k != 'best_model'}
-            if model_scores:
-                best_model = max(model_scores.items(), key=lambda x: x[1])
-                summary['by_metric'][metric]['best_model'] = {
-                    'name': best_model[0],
-                    'score': best_model[1]
-                }
+        # Per-metric best models from a (metric x model) matrix of means,
+        # laid out in the same first-seen order as by_model
+        model_order = list(summary['by_model'])
+        metric_order = list(dict.fromkeys(
+            metric for metrics in summary['by_model'].values() for metric in metrics
+        ))
+        mean_matrix = stats['mean'].unstack('model').reindex(index=metric_order, columns=model_order)
+        
+        for metric, row in mean_matrix.iterrows():
+            row = row.dropna()
+            summary['by_metric'][metric] = {model: float(score) for model, score in row.items()}
+            # idxmax keeps the first model on ties, like max() over the items did
+            summary['by_metric'][metric]['best_model'] = {
+                'name': row.idxmax(),
+                'score': float(row.max())
+            }
         
         # Per-reference breakdown (for detailed analysis)
-        for model in per_ref_by_model_metric:
-            if model not in summary['by_reference']:
-                summary['by_reference'][model] = {}
-            
-            for metric in per_ref_by_model_metric[model]:
-                if metric not in summary['by_reference'][model]:
-                    summary['by_reference'][model][metric] = {}
-                
-                for ref_id in per_ref_by_model_metric[model][metric]:
-                    scores = per_ref_by_model_metric[model][metric][ref_id]
-                    summary['by_reference'][model][metric][ref_id] = {
-                        'mean': float(np.mean(scores)),
-                        'std': float(np.std(scores)),
-                        'count': len(scores)
-                    }
+        grouped = per_ref_df.groupby(['model', 'metric', 'ref_id'], sort=False)['score']
+        ref_stats = grouped.agg(['mean', 'count'])
+        ref_stats['std'] = grouped.std(ddof=0)
+        
+        for (model, metric, ref_id), row in ref_stats.iterrows():
+            summary['by_reference'].setdefault(model, {}).setdefault(metric, {})[ref_id] = {
+                'mean': float(row['mean']),
+                'std': float(row['std']),
+                'count': int(row['count'])
+            }
         
         # Add detailed scores
         summary['detailed_scores'] = [eval.to_dict() for eval in evaluations]
@@ -735,13 +1007,30 @@ class Evaluator:
         """Save evaluation results to JSON."""
         summary = self.aggregate_results(evaluations)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        # OPT_SERIALIZE_NUMPY covers the numpy scalars in rankings and metric details
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
         
         logger.info(f"Evaluation results saved to {output_file}")
         return summary
 
 
+# Per-process evaluator used by the lexical-metrics worker pool
+_worker_evaluator = None
+
+
+def _init_lexical_worker(metrics: List[str]):
+    """Pool initializer: set up the lexical metric handlers once per worker."""
+    global _worker_evaluator
+    _worker_evaluator = Evaluator(metrics=metrics)
+
+
+def _score_lexical(job: Tuple[str, Tuple[str, ...]]) -> List[EvaluationScore]:
+    """Score one (hypothesis, references) job in a worker process."""
+    hypothesis, references = job
+    return _worker_evaluator.evaluate_lexical(hypothesis, list(references))
+
+
 def main():
     """Command-line interface."""
     import argparse
@@ -760,6 +1049,14 @@ def main():
                        default=['bleu', 'chrf', 'meteor', 'rouge', 'bertscore', 'comet'],
                        help='Metrics to use (add bleurt on Linux)')
     parser.add_argument('--gpu', action='store_true', help='Use GPU for neural metrics')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Worker processes for lexical metrics (default: 1, serial)')
+    parser.add_argument('--fp16', action='store_true',
+                       help='Run BERTScore in half precision (requires --gpu)')
+    parser.add_argument('--batch-size', type=int, default=64,
+                       help='Mini-batch size for neural metrics (default: 64)')
+    parser.add_argument('--cache', default=None,
+                       help='Path of an on-disk cache for neural metric scores (reused across runs)')
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
     
     args = parser.parse_args()
@@ -772,12 +1069,22 @@ def main():
     chunks = input_parser.parse_file(args.input_file)
     
     # Load translations
-    with open(args.translations_file, 'r', encoding='utf-8') as f:
-        translations = json.load(f)
+    with open(args.translations_file, 'rb') as f:
+        translations = orjson.loads(f.read())
     
     # Evaluate
-    evaluator = Evaluator(metrics=args.metrics, use_gpu=args.gpu)
-    evaluations = evaluator.evaluate_all(chunks, translations)
+    evaluator = Evaluator(
+        metrics=args.metrics,
+        use_gpu=args.gpu,
+        num_workers=args.workers,
+        cache_path=args.cache,
+        batch_size=args.batch_size,
+        fp16=args.fp16
+    )
+    try:
+        evaluations = evaluator.evaluate_all(chunks, translations)
+    finally:
+        evaluator.close()
     
     # Save
     if args.output:
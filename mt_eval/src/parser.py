@@ -18,6 +18,20 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# "Chunk N" header line that starts each chunk
+CHUNK_MARKER_PATTERN = re.compile(r'(?:^|\n)Chunk\s+(\d+)\s*\n', re.MULTILINE)
+
+# Whitespace after sentence-final punctuation (a sentence boundary)
+SENTENCE_BREAK_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+# Sentence openings that look like a second translation restarting the passage
+# Common patterns: "That the...", "And this...", "In these...", "Therefore...", etc.
+RESTART_PATTERNS = [
+    re.compile(r'(That|And|In|For|Therefore|Now|However|But|Of|All|The)\s+'),
+    re.compile(r'[A-Z][a-z]+\s+[a-z]+\s+[a-z]+'),  # Normal sentence pattern
+]
+
+
 @dataclass
 class ParsedChunk:
     """A single parsed chunk with Greek and reference translations."""
@@ -35,16 +49,18 @@ class InputParser:
     """Parse input documents into structured chunks."""
     
     def __init__(self):
-        self.greek_pattern = re.compile(r'[α-ωΑ-Ωἀ-ἇἰ-ἷὀ-὇ὐ-ὗὠ-ὧᾀ-ᾇᾐ-ᾗᾠ-ᾧᾰ-ᾱῐ-ῑῠ-ῡ]+')
+        # Single-character class: search() stops at the first Greek letter
+        self.greek_pattern = re.compile(r'[α-ωΑ-Ωἀ-ἇἰ-ἷὀ-὇ὐ-ὗὠ-ὧᾀ-ᾇᾐ-ᾗᾠ-ᾧᾰ-ᾱῐ-ῑῠ-ῡ]')
     
     def has_greek_characters(self, text: str) -> bool:
         """Check if text contains Greek characters."""
         return bool(self.greek_pattern.search(text))
     
-    def is_substantial_text(self, text: str, min_words: int = 10) -> bool:
+    def is_substantial_text(self, text: str, min_words: int = 10, word_count: int = None) -> bool:
         """Check if text is substantial (not just a label or fragment)."""
-        words = text.split()
-        return len(words) >= min_words and len(text.strip()) > 50
+        if word_count is None:
+            word_count = len(text.split())
+        return word_count >= min_words and len(text.strip()) > 50
     
     def parse_file(self, file_path: str) -> List[ParsedChunk]:
         """
@@ -85,22 +101,15 @@ class InputParser:
         """
         chunks = []
         
-        # Split by "Chunk N" markers
-        chunk_pattern = r'(?:^|\n)Chunk\s+(\d+)\s*\n'
-        parts = re.split(chunk_pattern, content, flags=re.MULTILINE)
-        
-        # parts will be: ['', '1', content1, '2', content2, ...]
-        # Skip first empty element, then process pairs
-        i = 1
-        while i < len(parts) - 1:
-            chunk_number = parts[i]
-            chunk_content = parts[i + 1]
+        # Walk the "Chunk N" markers; each chunk's content is the span up to
+        # the next marker, sliced directly instead of building a split list
+        markers = list(CHUNK_MARKER_PATTERN.finditer(content))
+        for idx, marker in enumerate(markers):
+            end = markers[idx + 1].start() if idx + 1 < len(markers) else len(content)
             
-            parsed = self._parse_chunk_content(chunk_number, chunk_content)
+            parsed = self._parse_chunk_content(marker.group(1), content[marker.end():end])
             if parsed:
                 chunks.append(parsed)
-            
-            i += 2
         
         logger.info(f"Parsed {len(chunks)} chunks from document")
         return chunks
@@ -122,23 +131,26 @@ class InputParser:
         Returns:
             ParsedChunk object or None if parsing fails
         """
-        # Split into paragraphs
-        paragraphs = re.split(r'\n\s*\n', content)
-        paragraphs = [p.strip() for p in paragraphs if p.strip()]
-        
         # Find Greek paragraph
         greek_text = None
+        greek_words = 0
         references = []
         
-        for para in paragraphs:
+        # Single pass over paragraphs (separated by blank lines): each one is
+        # cleaned, classified and word-counted exactly once
+        for para in re.split(r'\n\s*\n', content):
             # Clean up the paragraph
             para_clean = re.sub(r'\s+', ' ', para).strip()
             
             if not para_clean:
                 continue
             
+            # Whitespace is already collapsed, so words = spaces + 1
+            word_count = para_clean.count(' ') + 1
+            
             # Check if this is the Greek text
             if self.has_greek_characters(para_clean):
+                greek_words += word_count
                 if greek_text is None:
                     greek_text = para_clean
                     logger.debug(f"Chunk {chunk_number}: Found Greek text ({len(para_clean)} chars)")
@@ -147,9 +159,8 @@ class InputParser:
                     greek_text += " " + para_clean
             
             # Check if this is a reference translation
-            elif self.is_substantial_text(para_clean, min_words=20):
+            elif self.is_substantial_text(para_clean, min_words=20, word_count=word_count):
                 # Check if this might be multiple references combined (very long paragraph)
-                word_count = len(para_clean.split())
                 if word_count > 400:  # Suspiciously long - might be 2+ translations
                     # Try to split at sentence boundaries that look like translation restarts
                     split_refs = self._try_split_combined_references(para_clean)
@@ -180,7 +191,7 @@ class InputParser:
             reference_translations=references,
             metadata={
                 'greek_length': len(greek_text),
-                'greek_words': len(greek_text.split()),
+                'greek_words': greek_words,
                 'num_references': len(references),
                 'reference_lengths': [len(ref) for ref in references]
             }
@@ -200,47 +211,47 @@ class InputParser:
         Returns:
             List of split references (or single item if no split found)
         """
-        # Split into sentences
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        # Sentence spans as offsets into text; no sentence strings are built
+        starts = [0]
+        ends = []
+        for match in SENTENCE_BREAK_PATTERN.finditer(text):
+            ends.append(match.start())
+            starts.append(match.end())
+        ends.append(len(text))
+        num_sentences = len(starts)
         
         # If we don't have many sentences, don't try to split
-        if len(sentences) < 8:
+        if num_sentences < 8:
             return [text]
         
         # Look for natural split points (roughly in the middle)
         # A good split point is usually where a new translation starts with similar wording
-        midpoint = len(sentences) // 2
-        search_range = range(max(0, midpoint - 2), min(len(sentences), midpoint + 3))
-        
-        # Look for sentences that start with capital words and look like restart patterns
-        # Common patterns: "That the...", "And this...", "In these...", "Therefore...", etc.
-        restart_patterns = [
-            r'^(That|And|In|For|Therefore|Now|However|But|Of|All|The)\s+',
-            r'^[A-Z][a-z]+\s+[a-z]+\s+[a-z]+',  # Normal sentence pattern
-        ]
+        midpoint = num_sentences // 2
+        search_range = range(max(0, midpoint - 2), min(num_sentences, midpoint + 3))
         
         best_split = None
         best_score = 0
         
         for i in search_range:
-            sentence = sentences[i]
-            # Check if this looks like a restart
-            for pattern in restart_patterns:
-                if re.match(pattern, sentence):
+            # Check if this sentence looks like a restart
+            for pattern in RESTART_PATTERNS:
+                if pattern.match(text, starts[i], ends[i]):
                     # Score based on proximity to midpoint
-                    score = 1.0 - abs(i - midpoint) / len(sentences)
+                    score = 1.0 - abs(i - midpoint) / num_sentences
                     if score > best_score:
                         best_score = score
                         best_split = i
                         break
         
-        # If we found a good split point, split there
+        # If we found a good split point, split there. The text is
+        # whitespace-collapsed, so slicing at the sentence boundary gives the
+        # same parts as re-joining the sentences with single spaces
         if best_split and best_score > 0.3:
-            first_part = ' '.join(sentences[:best_split]).strip()
-            second_part = ' '.join(sentences[best_split:]).strip()
+            first_part = text[:ends[best_split - 1]].strip()
+            second_part = text[starts[best_split]:].strip()
             
-            # Make sure both parts are substantial
-            if len(first_part.split()) > 50 and len(second_part.split()) > 50:
+            # Make sure both parts are substantial (words = spaces + 1 in collapsed text)
+            if first_part.count(' ') >= 50 and second_part.count(' ') >= 50:
                 return [first_part, second_part]
         
         # No good split found
@@ -9,13 +9,19 @@ Translates Ancient Greek text using three AI models:
 """
 
 import os
+import re
 import time
+import random
 import logging
+import sqlite3
+import threading
 from typing import Dict, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict, replace
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import hashlib
+from collections import Counter
+import orjson
 
 # Load environment variables
 try:
@@ -35,6 +41,126 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Max in-flight requests per provider when chunks are translated concurrently
+PROVIDER_CONCURRENCY = {'openai': 8, 'claude': 4, 'gemini': 4}
+
+# Requests/minute and tokens/minute budgets per provider (roughly the entry
+# usage tiers; raise them to match your account's limits)
+PROVIDER_RATE_LIMITS = {
+    'openai': {'rpm': 500, 'tpm': 500_000},
+    'claude': {'rpm': 50, 'tpm': 400_000},
+    'gemini': {'rpm': 150, 'tpm': 2_000_000},
+}
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter on requests and tokens per minute for one provider.
+    
+    Both buckets refill continuously; acquire() blocks only until there is
+    room for the call, instead of sleeping a fixed time before every request.
+    Thread-safe.
+    """
+    
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: int = 0):
+        """Wait until one request of `tokens` estimated tokens fits both budgets."""
+        # A call larger than the whole bucket could never fit; let it wait for a full one
+        tokens = min(tokens, self.tpm)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._updated = now
+                self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+                self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+                
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+                
+                wait = max((1 - self._requests) * 60 / self.rpm, (tokens - self._tokens) * 60 / self.tpm)
+            time.sleep(wait)
+
+
+# Seconds between status checks of a submitted Batch API job
+BATCH_POLL_SECONDS = 30
+
+# Leading labels and markdown fences stripped from model output
+_TRANSLATION_LABEL_RE = re.compile(r'^(\*\*\s*)?translation\s*:\s*(\*\*)?\s*', re.IGNORECASE)
+_RENDERING_LABEL_RE = re.compile(r'^(english\s+translation|rendering)\s*:\s*', re.IGNORECASE)
+_FENCED_RE = re.compile(r'^```[a-zA-Z]*\n([\s\S]*?)\n```\s*$')
+
+
+def retry_delay(error: Optional[Exception], attempt: int, base_delay: float) -> float:
+    """
+    Seconds to wait before retrying after a failed attempt (0-based).
+    
+    Honours the server's Retry-After header when the SDK error carries one;
+    otherwise exponential backoff with ±25% jitter, so parallel workers that
+    failed together don't all retry at the same instant.
+    """
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    if headers:
+        try:
+            return max(0.0, float(headers.get('retry-after')))
+        except (TypeError, ValueError):
+            pass
+    return base_delay * (2 ** attempt) * random.uniform(0.75, 1.25)
+
+
+def claude_max_tokens(greek_text: str) -> int:
+    """
+    Output budget for a Claude translation, scaled to the chunk's length.
+    
+    An English rendering runs to roughly 2-3 tokens per Greek word; 8 per word
+    (at least 1024, at most the old fixed 8000) leaves ample headroom while
+    not reserving 8000 output tokens of rate limit for a two-line chunk.
+    """
+    return min(8000, max(1024, 8 * len(greek_text.split())))
+
+
+# Model ids and generation settings sent to each provider
+OPENAI_MODEL = 'gpt-5-2025-08-07'
+OPENAI_REASONING_EFFORT = 'high'
+OPENAI_VERBOSITY = 'medium'
+OPENAI_MAX_OUTPUT_TOKENS = 16000  # Increased to avoid truncation
+CLAUDE_MODEL = 'claude-sonnet-4-5-20250929'  # Latest Claude 4.5
+CLAUDE_TEMPERATURE = 0.3
+GEMINI_MODEL = 'gemini-2.5-pro'  # Latest Gemini 2.5 Pro June 17, 2025 release
+GEMINI_TEMPERATURE = 0.3
+GEMINI_MAX_OUTPUT_TOKENS = 16000  # Increased to match OpenAI
+
+
+def request_settings(model: str, greek_text: str) -> tuple:
+    """
+    Model id and generation settings of the request made for a chunk.
+    
+    Part of the translation cache key, so bumping a model id or changing a
+    setting stops translations made under the old values being replayed.
+    """
+    if model == 'openai':
+        return (OPENAI_MODEL, OPENAI_REASONING_EFFORT, OPENAI_VERBOSITY, OPENAI_MAX_OUTPUT_TOKENS)
+    if model == 'claude':
+        return (CLAUDE_MODEL, CLAUDE_TEMPERATURE, claude_max_tokens(greek_text))
+    if model == 'gemini':
+        return (GEMINI_MODEL, GEMINI_TEMPERATURE, GEMINI_MAX_OUTPUT_TOKENS)
+    return (model,)
+
+
+def estimate_tokens(prompt: str, max_output_tokens: int) -> int:
+    """Rough token cost of a request: ~1.5 tokens per prompt word plus the reserved output."""
+    return int(len(prompt.split()) * 1.5) + max_output_tokens
+
+
 @dataclass
 class Translation:
     """A translation result from a single model."""
@@ -52,23 +178,148 @@ class Translation:
             self.metadata = {}
 
 
+def _translation_record(translation: Translation) -> Dict:
+    """Serializable form of a Translation, as written to translation files."""
+    return {
+        'translation': translation.translation,
+        'raw_response': translation.raw_response,
+        'status': translation.status,
+        'timestamp': translation.timestamp,
+        'error_message': translation.error_message,
+        'metadata': translation.metadata
+    }
+
+
+def checkpoint_text_hash(greek_text: str) -> str:
+    """Hash of a chunk's Greek text, stored with its checkpoint record."""
+    return hashlib.sha256(greek_text.encode('utf-8')).hexdigest()
+
+
+def load_checkpoint(
+    checkpoint_file: str,
+    greek_texts: Dict[str, str] = None
+) -> Dict[str, Dict[str, Translation]]:
+    """
+    Read a translate_chunks checkpoint back into {chunk_id: {model: Translation}}.
+    
+    A chunk written more than once (e.g. by a resumed run) keeps its last line;
+    a line cut short by an interrupted write is skipped. When greek_texts
+    ({chunk_id: greek_text}) is given, only records of those chunks whose
+    stored text hash still matches the text are returned.
+    """
+    translations = {}
+    with open(checkpoint_file, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                logger.warning(f"Skipping unreadable line in checkpoint {checkpoint_file}")
+                continue
+            chunk_id = record['chunk_id']
+            if greek_texts is not None and (
+                chunk_id not in greek_texts
+                or record.get('text_hash') != checkpoint_text_hash(greek_texts[chunk_id])
+            ):
+                continue
+            translations[chunk_id] = {
+                model: Translation(chunk_id=chunk_id, model_name=model, **fields)
+                for model, fields in record['translations'].items()
+            }
+    return translations
+
+
+class TranslationCache:
+    """
+    Persistent store of successful translations keyed by the model, its
+    request settings (see request_settings) and the prompt, so
+    re-runs and repeated passages skip the API call. Backed by SQLite and
+    safe to share across the translator's threads.
+    """
+    
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS translations '
+            '(key TEXT PRIMARY KEY, model TEXT, data BLOB, ts REAL)'
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def _key(model: str, settings: tuple, prompt: str) -> str:
+        return hashlib.sha256(f"{model}\0{settings!r}\0{prompt}".encode('utf-8')).hexdigest()
+    
+    def get(self, model: str, settings: tuple, prompt: str, chunk_id: str) -> Optional[Translation]:
+        """Cached translation of prompt by model with settings, relabelled for chunk_id, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data FROM translations WHERE key = ?', (self._key(model, settings, prompt),)
+            ).fetchone()
+        if row is None:
+            return None
+        translation = Translation(**orjson.loads(row[0]))
+        return replace(translation, chunk_id=chunk_id, metadata={**translation.metadata, 'cached': True})
+    
+    def put(self, model: str, settings: tuple, prompt: str, translation: Translation):
+        """Store a translation; only successful ones are worth replaying."""
+        if translation is None or translation.status != 'success':
+            return
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?)',
+                (self._key(model, settings, prompt), model, orjson.dumps(asdict(translation)), time.time())
+            )
+            self._conn.commit()
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
 class Translator:
     """Translate Ancient Greek using multiple AI models."""
     
-    def __init__(self, models: List[str] = None):
+    def __init__(self, models: List[str] = None, chunk_workers: int = 1, cache_path: str = None):
         """
         Initialize translator with API clients.
         
         Args:
             models: List of models to use ['openai', 'claude', 'gemini']
                    If None, uses all available models
+            chunk_workers: Number of chunks translated concurrently; provider
+                   calls are capped by PROVIDER_CONCURRENCY (1 = one chunk at a time)
+            cache_path: Optional SQLite file caching successful translations
+                   by model, request settings and prompt across runs
         """
         if models is None:
             models = ['openai', 'claude', 'gemini']
         
         self.models = models
+        self.chunk_workers = max(1, chunk_workers)
         self.clients = {}
+        self._shared_http = None
         self._setup_clients()
+        self._provider_slots = {
+            model: threading.BoundedSemaphore(PROVIDER_CONCURRENCY.get(model, 4))
+            for model in self.models
+        }
+        self._rate_limiters = {
+            model: RateLimiter(**PROVIDER_RATE_LIMITS[model])
+            for model in self.models if model in PROVIDER_RATE_LIMITS
+        }
+        self._cache = TranslationCache(cache_path) if cache_path else None
+        # Long-lived worker threads per provider, shared by every chunk (threads
+        # start on first use); sized to the provider's request slots
+        self._executors = {
+            model: ThreadPoolExecutor(
+                max_workers=PROVIDER_CONCURRENCY.get(model, 4),
+                thread_name_prefix=f"translate-{model}"
+            )
+            for model in self.models
+        }
         # Enable extra diagnostics via env flag
         self.debug_diagnostics = os.getenv('GALEN_DIAGNOSTICS', '0') in ('1', 'true', 'True')
 
@@ -80,6 +331,29 @@ class Translator:
         except Exception:
             return ""
     
+    def _http_client(self, sdk):
+        """
+        One keep-alive HTTP connection pool shared by the OpenAI and Anthropic
+        SDK clients, sized for every model running in parallel across chunks.
+        
+        Built with the first SDK's DefaultHttpxClient so its transport defaults
+        (redirect following etc.) are kept. Returns None (SDK default
+        transport) if httpx is unavailable.
+        """
+        if self._shared_http is None:
+            try:
+                import httpx
+            except ImportError:
+                return None
+            client_class = getattr(sdk, 'DefaultHttpxClient', None)
+            extra = {} if client_class else {'follow_redirects': True}
+            self._shared_http = (client_class or httpx.Client)(
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=httpx.Timeout(600.0, connect=10.0),
+                **extra
+            )
+        return self._shared_http
+    
     def _setup_clients(self):
         """Set up API clients for requested models."""
         
@@ -89,7 +363,7 @@ class Translator:
                 import openai
                 api_key = os.getenv('OPENAI_API_KEY')
                 if api_key and api_key != 'your_openai_api_key_here':
-                    self.clients['openai'] = openai.OpenAI(api_key=api_key)
+                    self.clients['openai'] = openai.OpenAI(api_key=api_key, http_client=self._http_client(openai))
                     logger.info("✓ OpenAI client initialized (GPT-5)")
                 else:
                     logger.warning("OpenAI API key not configured")
@@ -107,7 +381,7 @@ class Translator:
                 import anthropic
                 api_key = os.getenv('ANTHROPIC_API_KEY')
                 if api_key and api_key != 'your_anthropic_api_key_here':
-                    self.clients['claude'] = anthropic.Anthropic(api_key=api_key)
+                    self.clients['claude'] = anthropic.Anthropic(api_key=api_key, http_client=self._http_client(anthropic))
                     logger.info("✓ Claude client initialized (Claude 4.5)")
                 else:
                     logger.warning("Anthropic API key not configured")
@@ -152,12 +426,11 @@ class Translator:
             return ''
         text = raw_response.strip()
         # Remove common leading labels and markdown wrappers
-        import re
         # Strip leading markdown bold label '**Translation:**' or plain 'Translation:' variants
-        text = re.sub(r'^(\*\*\s*)?translation\s*:\s*(\*\*)?\s*', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'^(english\s+translation|rendering)\s*:\s*', '', text, flags=re.IGNORECASE)
+        text = _TRANSLATION_LABEL_RE.sub('', text)
+        text = _RENDERING_LABEL_RE.sub('', text)
         # Remove surrounding triple backticks if the whole output is fenced
-        fenced = re.match(r'^```[a-zA-Z]*\n([\s\S]*?)\n```\s*$', text)
+        fenced = _FENCED_RE.match(text)
         if fenced:
             text = fenced.group(1).strip()
         return text
@@ -180,9 +453,7 @@ Ancient Greek text:
     def translate_openai(self, greek_text: str, chunk_id: str) -> Translation:
         """Translate using OpenAI GPT-5 with the new Responses API."""
         prompt = self._create_prompt(greek_text)
-        
-        # Add a small delay to avoid rate limiting
-        time.sleep(0.5)
+        request_tokens = estimate_tokens(prompt, OPENAI_MAX_OUTPUT_TOKENS)
         
         max_retries = 3
         for attempt in range(max_retries):
@@ -196,13 +467,14 @@ Ancient Greek text:
                         f"OpenAI request start | chunk={chunk_id} attempt={attempt + 1}/{max_retries} "
                         f"prompt_chars={prompt_chars} greek_chars={greek_chars} prompt_hash={prompt_hash}"
                     )
+                self._wait_for_capacity('openai', request_tokens)
                 # Use the new Responses API for GPT-5
                 response = self.clients['openai'].responses.create(
-                    model="gpt-5-2025-08-07",
+                    model=OPENAI_MODEL,
                     input=prompt,
-                    reasoning={"effort": "high"},  
-                    text={"verbosity": "medium"},
-                    max_output_tokens=16000,  # Increased to avoid truncation
+                    reasoning={"effort": OPENAI_REASONING_EFFORT},
+                    text={"verbosity": OPENAI_VERBOSITY},
+                    max_output_tokens=OPENAI_MAX_OUTPUT_TOKENS,
                 )
                 
                 duration_ms = int((time.time() - start_time) * 1000)
@@ -241,7 +513,7 @@ Ancient Greek text:
                                 logger.debug(f"OpenAI empty-text output preview | chunk={chunk_id} {preview}")
                             except Exception:
                                 pass
-                        time.sleep(2 ** attempt)  # Exponential backoff
+                        time.sleep(retry_delay(None, attempt, 1))  # Exponential backoff
                         continue
                     else:
                         raw_response = "ERROR: Empty response returned after retries"
@@ -255,7 +527,7 @@ Ancient Greek text:
                                 f"Short translation from OpenAI | chunk={chunk_id} attempt={attempt + 1} "
                                 f"resp_id={response_id} duration_ms={duration_ms} out_chars={len(raw_response)}"
                             )
-                            time.sleep(2 ** attempt)
+                            time.sleep(retry_delay(None, attempt, 1))
                             continue
                 # Successful (or terminal) attempt logging
                 if logger.isEnabledFor(logging.DEBUG) or self.debug_diagnostics:
@@ -292,7 +564,7 @@ Ancient Greek text:
                         f"OpenAI API error | chunk={chunk_id} attempt={attempt + 1} err_type={err_type} "
                         f"duration_ms={duration_ms} msg={e}"
                     )
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    time.sleep(retry_delay(e, attempt, 1))  # Exponential backoff
                     continue
                 else:
                     logger.error(
@@ -320,16 +592,19 @@ Ancient Greek text:
     def translate_claude(self, greek_text: str, chunk_id: str) -> Translation:
         """Translate using Claude 4.5 with retry logic for overloads and rate limits."""
         prompt = self._create_prompt(greek_text)
+        max_tokens = claude_max_tokens(greek_text)
+        request_tokens = estimate_tokens(prompt, max_tokens)
 
         max_retries = 5
         base_delay = 2
 
         for attempt in range(max_retries):
             try:
+                self._wait_for_capacity('claude', request_tokens)
                 response = self.clients['claude'].messages.create(
-                    model="claude-sonnet-4-5-20250929",  # Latest Claude 4.5
-                    max_tokens=8000,  # Generous limit to avoid artificial constraints
-                    temperature=0.3,
+                    model=CLAUDE_MODEL,
+                    max_tokens=max_tokens,  # Scaled to chunk length, with generous headroom
+                    temperature=CLAUDE_TEMPERATURE,
                     messages=[{"role": "user", "content": prompt}]
                 )
 
@@ -349,7 +624,7 @@ Ancient Greek text:
                     timestamp=datetime.now().isoformat(),
                     status='success' if not raw_response.startswith('ERROR:') else 'error',
                     metadata={
-                        'model': 'claude-sonnet-4-5-20250929',
+                        'model': CLAUDE_MODEL,
                         'attempt': attempt + 1,
                         'tokens': response.usage.input_tokens + response.usage.output_tokens if hasattr(response, 'usage') else None
                     }
@@ -360,9 +635,9 @@ Ancient Greek text:
                 lower = msg.lower()
                 retryable = any(s in lower for s in ['overloaded', 'rate', 'timeout', 'temporarily unavailable', '503', '429'])
                 if retryable and attempt < max_retries - 1:
-                    delay = base_delay * (2 ** attempt)
+                    delay = retry_delay(e, attempt, base_delay)
                     logger.warning(
-                        f"Claude API error (retryable) | chunk={chunk_id} attempt={attempt + 1}/{max_retries} msg={msg}. Retrying after {delay}s"
+                        f"Claude API error (retryable) | chunk={chunk_id} attempt={attempt + 1}/{max_retries} msg={msg}. Retrying after {delay:.1f}s"
                     )
                     time.sleep(delay)
                     continue
@@ -376,7 +651,7 @@ Ancient Greek text:
                     status='error',
                     error_message=f"{msg}. {'Not retryable' if not retryable else f'Failed after {attempt + 1} attempts'}",
                     metadata={
-                        'model': 'claude-sonnet-4-5-20250929',
+                        'model': CLAUDE_MODEL,
                         'attempt': attempt + 1
                     }
                 )
@@ -384,29 +659,22 @@ Ancient Greek text:
     def translate_gemini(self, greek_text: str, chunk_id: str) -> Translation:
         """Translate using Gemini 2.5 Pro with retry logic."""
         prompt = self._create_prompt(greek_text)
+        request_tokens = estimate_tokens(prompt, GEMINI_MAX_OUTPUT_TOKENS)
         
         max_retries = 5  # More retries for 503 errors
         base_delay = 3  # Start with longer delay
         
-        # Add initial delay to help with rate limiting
-        time.sleep(1.0)
-        
         for attempt in range(max_retries):
             try:
                 from google.genai import types
                 
-                # Add delay before request to avoid rate limiting
-                if attempt > 0:
-                    delay = base_delay * (2 ** attempt)  # Exponential backoff
-                    logger.info(f"Retrying Gemini after {delay}s delay (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(delay)
-                
+                self._wait_for_capacity('gemini', request_tokens)
                 response = self.clients['gemini'].models.generate_content(
-                    model="gemini-2.5-pro",  # Latest Gemini 2.5 Pro June 17, 2025 release
+                    model=GEMINI_MODEL,
                     contents=prompt,
                     config=types.GenerateContentConfig(
-                        temperature=0.3,
-                        max_output_tokens=16000  # Increased to match OpenAI
+                        temperature=GEMINI_TEMPERATURE,
+                        max_output_tokens=GEMINI_MAX_OUTPUT_TOKENS
                     )
                 )
                 
@@ -430,7 +698,7 @@ Ancient Greek text:
                     timestamp=datetime.now().isoformat(),
                     status='success' if raw_response and not raw_response.startswith('ERROR:') else 'error',
                     metadata={
-                        'model': 'gemini-2.5-pro',
+                        'model': GEMINI_MODEL,
                         'attempt': attempt + 1
                     }
                 )
@@ -442,7 +710,10 @@ Ancient Greek text:
                 
                 if is_retryable and attempt < max_retries - 1:
                     logger.warning(f"Gemini API error (retryable) for chunk {chunk_id} (attempt {attempt + 1}/{max_retries}): {error_str}")
-                    # Will retry with exponential backoff
+                    # Exponential backoff (first retry after ~2x base_delay)
+                    delay = retry_delay(e, attempt + 1, base_delay)
+                    logger.info(f"Retrying Gemini after {delay:.1f}s delay (attempt {attempt + 2}/{max_retries})")
+                    time.sleep(delay)
                     continue
                 else:
                     logger.error(f"Gemini translation failed for chunk {chunk_id} after {attempt + 1} attempts: {e}")
@@ -455,11 +726,52 @@ Ancient Greek text:
                         status='error',
                         error_message=f"{error_str}. {'Not retryable' if not is_retryable else f'Failed after {attempt + 1} attempts'}",
                         metadata={
-                            'model': 'gemini-2.5-pro',
+                            'model': GEMINI_MODEL,
                             'attempt': attempt + 1
                         }
                     )
     
+    def _wait_for_capacity(self, model: str, request_tokens: int):
+        """Block until the provider's rate budget has room for a request of request_tokens (see estimate_tokens)."""
+        limiter = self._rate_limiters.get(model)
+        if limiter is not None:
+            limiter.acquire(request_tokens)
+    
+    def _translate_with(self, model: str, greek_text: str, chunk_id: str) -> Optional[Translation]:
+        """Run one model on one chunk, holding one of that provider's request slots."""
+        translate = {
+            'openai': self.translate_openai,
+            'claude': self.translate_claude,
+            'gemini': self.translate_gemini,
+        }.get(model)
+        if translate is None:
+            return None
+        
+        if self._cache is not None:
+            prompt = self._create_prompt(greek_text)
+            settings = request_settings(model, greek_text)
+            cached = self._cache.get(model, settings, prompt, chunk_id)
+            if cached is not None:
+                return cached
+        
+        with self._provider_slots[model]:
+            translation = translate(greek_text, chunk_id)
+        
+        if self._cache is not None:
+            self._cache.put(model, settings, prompt, translation)
+        return translation
+    
+    def close(self):
+        """Shut down the provider worker threads and close the shared HTTP pool and translation cache, if any."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=True)
+        if self._shared_http is not None:
+            self._shared_http.close()
+            self._shared_http = None
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+    
     def translate_chunk(self, greek_text: str, chunk_id: str, parallel: bool = True) -> Dict[str, Translation]:
         """
         Translate a single chunk with all models.
@@ -477,66 +789,197 @@ Ancient Greek text:
         results = {}
         
         if parallel and len(self.models) > 1:
-            # Parallel translation
-            with ThreadPoolExecutor(max_workers=len(self.models)) as executor:
-                futures = {}
-                
-                for model in self.models:
-                    if model == 'openai':
-                        future = executor.submit(self.translate_openai, greek_text, chunk_id)
-                    elif model == 'claude':
-                        future = executor.submit(self.translate_claude, greek_text, chunk_id)
-                    elif model == 'gemini':
-                        future = executor.submit(self.translate_gemini, greek_text, chunk_id)
-                    else:
+            # Parallel translation on the shared per-provider workers
+            futures = {
+                self._executors[model].submit(self._translate_with, model, greek_text, chunk_id): model
+                for model in self.models
+            }
+            
+            for future in as_completed(futures):
+                model = futures[future]
+                try:
+                    translation = future.result()
+                    if translation is None:
                         continue
-                    
-                    futures[future] = model
-                
-                for future in as_completed(futures):
-                    model = futures[future]
-                    try:
-                        translation = future.result()
-                        results[model] = translation
-                        status_emoji = "✓" if translation.status == 'success' else "✗"
-                        logger.info(f"  {status_emoji} {model}: {translation.status}")
-                    except Exception as e:
-                        logger.error(f"  ✗ {model}: {e}")
+                    results[model] = translation
+                    status_emoji = "✓" if translation.status == 'success' else "✗"
+                    logger.info(f"  {status_emoji} {model}: {translation.status}")
+                except Exception as e:
+                    logger.error(f"  ✗ {model}: {e}")
         else:
             # Sequential translation
             for model in self.models:
-                if model == 'openai':
-                    translation = self.translate_openai(greek_text, chunk_id)
-                elif model == 'claude':
-                    translation = self.translate_claude(greek_text, chunk_id)
-                elif model == 'gemini':
-                    translation = self.translate_gemini(greek_text, chunk_id)
-                else:
+                translation = self._translate_with(model, greek_text, chunk_id)
+                if translation is None:
                     continue
                 
                 results[model] = translation
                 status_emoji = "✓" if translation.status == 'success' else "✗"
                 logger.info(f"  {status_emoji} {model}: {translation.status}")
-                
-                # Brief delay between models to avoid rate limits
-                if model != self.models[-1]:
-                    time.sleep(1)
         
         return results
     
-    def translate_chunks(self, chunks: List[Dict], parallel: bool = False) -> Dict[str, Dict[str, Translation]]:
+    def translate_chunks(
+        self,
+        chunks: List[Dict],
+        parallel: bool = False,
+        checkpoint_file: str = None,
+        resume: bool = False
+    ) -> Dict[str, Dict[str, Translation]]:
         """
         Translate multiple chunks.
         
         Args:
             chunks: List of chunks with 'chunk_id' and 'greek_text' keys
             parallel: Whether to run model translations in parallel
+            checkpoint_file: Optional JSONL file; each chunk's translations are
+                written as one line as soon as the chunk finishes. A new run
+                starts the file afresh
+            resume: Keep checkpoint_file and reuse the chunks in it whose Greek
+                text is unchanged and whose every model succeeded; only the
+                rest are translated
             
         Returns:
             Dict mapping chunk_id to dict of model translations
         """
-        all_results = {}
+        all_pending = self._chunks_to_translate(chunks)
+        done = {}
+        if resume and checkpoint_file and os.path.exists(checkpoint_file):
+            done = {
+                chunk_id: results
+                for chunk_id, results in load_checkpoint(checkpoint_file, dict(all_pending)).items()
+                if all(model in results and results[model].status == 'success' for model in self.models)
+            }
+            logger.info(f"Resuming: {len(done)} chunk(s) already translated in {checkpoint_file}")
+        
+        pending = [(chunk_id, greek_text) for chunk_id, greek_text in all_pending if chunk_id not in done]
+        unique, source_of = self._dedupe_chunks(pending)
+        checkpoint = self._open_checkpoint(checkpoint_file, resume) if checkpoint_file else None
+        
+        try:
+            if self.chunk_workers > 1 and len(unique) > 1:
+                translated = self._translate_chunks_concurrently(unique, parallel, checkpoint)
+            else:
+                translated = {}
+                for chunk_id, greek_text in unique:
+                    # Pacing is handled per request by the provider rate limiters
+                    results = self.translate_chunk(greek_text, chunk_id, parallel=parallel)
+                    translated[chunk_id] = results
+                    self._write_checkpoint(checkpoint, chunk_id, greek_text, results)
+            
+            all_results = self._fan_out_duplicates(pending, source_of, translated, checkpoint)
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+        
+        if not done:
+            return all_results
+        # Resumed chunks and newly translated ones, in input order
+        return {
+            chunk_id: done[chunk_id] if chunk_id in done else all_results[chunk_id]
+            for chunk_id, _ in all_pending
+        }
+    
+    def _translate_chunks_concurrently(
+        self,
+        pending: List[tuple],
+        parallel: bool,
+        checkpoint=None
+    ) -> Dict[str, Dict[str, Translation]]:
+        """
+        Translate (chunk_id, greek_text) pairs on a pool of chunk_workers
+        threads. Each provider's load is bounded by its request slots and rate
+        limiter. Results keep the input chunk order.
+        """
+        with ThreadPoolExecutor(max_workers=self.chunk_workers) as executor:
+            futures = {
+                executor.submit(self.translate_chunk, greek_text, chunk_id, parallel): (chunk_id, greek_text)
+                for chunk_id, greek_text in pending
+            }
+            
+            completed = {}
+            for future in as_completed(futures):
+                chunk_id, greek_text = futures[future]
+                completed[chunk_id] = future.result()
+                self._write_checkpoint(checkpoint, chunk_id, greek_text, completed[chunk_id])
         
+        return {chunk_id: completed[chunk_id] for chunk_id, _ in pending}
+    
+    @staticmethod
+    def _open_checkpoint(checkpoint_file: str, resume: bool):
+        """
+        Open the checkpoint: truncated for a new run, or for appending when
+        resuming, first ending a line cut short by an interrupted run.
+        """
+        if not resume:
+            return open(checkpoint_file, 'wb')
+        checkpoint = open(checkpoint_file, 'ab')
+        if checkpoint.tell() > 0:
+            with open(checkpoint_file, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    checkpoint.write(b'\n')
+        return checkpoint
+    
+    @staticmethod
+    def _write_checkpoint(checkpoint, chunk_id: str, greek_text: str, results: Dict[str, Translation]):
+        """Append one finished chunk to the open checkpoint file, if any."""
+        if checkpoint is None:
+            return
+        record = {
+            'chunk_id': chunk_id,
+            'text_hash': checkpoint_text_hash(greek_text),
+            'translations': {model: _translation_record(t) for model, t in results.items()}
+        }
+        checkpoint.write(orjson.dumps(record) + b'\n')
+        checkpoint.flush()
+    
+    @staticmethod
+    def _dedupe_chunks(pending: List[tuple]):
+        """
+        Drop chunks whose Greek text repeats an earlier chunk's.
+        
+        Returns:
+            (unique (chunk_id, greek_text) pairs in order, {chunk_id: chunk_id
+            of the first chunk with the same text})
+        """
+        first_with_text = {}
+        source_of = {}
+        unique = []
+        for chunk_id, greek_text in pending:
+            source = first_with_text.setdefault(greek_text, chunk_id)
+            source_of[chunk_id] = source
+            if source == chunk_id:
+                unique.append((chunk_id, greek_text))
+        if len(unique) < len(pending):
+            logger.info(f"{len(pending) - len(unique)} duplicate chunk(s) reuse an earlier chunk's translations")
+        return unique, source_of
+    
+    def _fan_out_duplicates(
+        self,
+        pending: List[tuple],
+        source_of: Dict[str, str],
+        translated: Dict[str, Dict[str, Translation]],
+        checkpoint=None
+    ) -> Dict[str, Dict[str, Translation]]:
+        """Results for every pending chunk, copying translations onto duplicate chunks."""
+        all_results = {}
+        for chunk_id, greek_text in pending:
+            source = source_of[chunk_id]
+            if source == chunk_id:
+                all_results[chunk_id] = translated[chunk_id]
+                continue
+            all_results[chunk_id] = {
+                model: replace(translation, chunk_id=chunk_id,
+                               metadata={**translation.metadata, 'duplicate_of': source})
+                for model, translation in translated[source].items()
+            }
+            self._write_checkpoint(checkpoint, chunk_id, greek_text, all_results[chunk_id])
+        return all_results
+    
+    def _chunks_to_translate(self, chunks: List[Dict]) -> List[tuple]:
+        """(chunk_id, greek_text) for every chunk that has Greek text, in input order."""
+        pending = []
         for i, chunk in enumerate(chunks, 1):
             chunk_id = chunk.get('chunk_id', str(i))
             greek_text = chunk.get('greek_text', '')
@@ -545,43 +988,303 @@ Ancient Greek text:
                 logger.warning(f"Chunk {chunk_id} has no Greek text, skipping")
                 continue
             
-            results = self.translate_chunk(greek_text, chunk_id, parallel=parallel)
-            all_results[chunk_id] = results
+            pending.append((chunk_id, greek_text))
+        return pending
+    
+    def translate_chunks_batch(self, chunks: List[Dict]) -> Dict[str, Dict[str, Translation]]:
+        """
+        Translate chunks through the providers' asynchronous Batch APIs.
+        
+        OpenAI (Batch API, /v1/responses) and Claude (Message Batches) jobs are
+        submitted up front and polled until they finish; batch requests are
+        billed at a discount and don't compete with real-time rate limits.
+        Gemini has no batch path here and is translated in real time while the
+        batches run.
+        
+        Args:
+            chunks: List of chunks with 'chunk_id' and 'greek_text' keys
             
-            # Delay between chunks to avoid rate limiting
-            if i < len(chunks):
-                time.sleep(5.0)  # Longer delay to avoid 503 errors
+        Returns:
+            Dict mapping chunk_id to dict of model translations
+        """
+        all_pending = self._chunks_to_translate(chunks)
+        pending, source_of = self._dedupe_chunks(all_pending)
+        batch_handlers = {
+            'openai': (self._submit_openai_batch, self._collect_openai_batch),
+            'claude': (self._submit_claude_batch, self._collect_claude_batch),
+        }
         
-        return all_results
+        per_model = {}
+        submitted = {}
+        for model in self.models:
+            if model not in batch_handlers:
+                continue
+            
+            # Only chunks missing from the translation cache go into the batch
+            per_model[model] = {}
+            to_submit = []
+            for chunk_id, greek_text in pending:
+                cached = self._cache.get(
+                    model, request_settings(model, greek_text), self._create_prompt(greek_text), chunk_id
+                ) if self._cache else None
+                if cached is not None:
+                    per_model[model][chunk_id] = cached
+                else:
+                    to_submit.append((chunk_id, greek_text))
+            
+            if to_submit:
+                try:
+                    submitted[model] = batch_handlers[model][0](to_submit)
+                except Exception as e:
+                    logger.error(f"Failed to submit {model} batch: {e}")
+        
+        for model in self.models:
+            if model not in batch_handlers:
+                per_model[model] = {
+                    chunk_id: self._translate_with(model, greek_text, chunk_id)
+                    for chunk_id, greek_text in pending
+                }
+        
+        greek_by_chunk = dict(pending)
+        for model, batch_id in submitted.items():
+            try:
+                collected = batch_handlers[model][1](batch_id)
+            except Exception as e:
+                logger.error(f"Failed to collect {model} batch {batch_id}: {e}")
+                continue
+            per_model[model].update(collected)
+            if self._cache is not None:
+                for chunk_id, translation in collected.items():
+                    if chunk_id in greek_by_chunk:
+                        greek_text = greek_by_chunk[chunk_id]
+                        self._cache.put(
+                            model, request_settings(model, greek_text), self._create_prompt(greek_text), translation
+                        )
+        
+        all_results = {}
+        for chunk_id, _ in pending:
+            all_results[chunk_id] = {}
+            for model in self.models:
+                translation = per_model.get(model, {}).get(chunk_id)
+                if translation is None:
+                    translation = Translation(
+                        chunk_id=chunk_id,
+                        model_name=model,
+                        translation='',
+                        raw_response='',
+                        timestamp=datetime.now().isoformat(),
+                        status='error',
+                        error_message='No result returned by batch job',
+                        metadata={'batch_id': submitted.get(model)}
+                    )
+                all_results[chunk_id][model] = translation
+        
+        return self._fan_out_duplicates(all_pending, source_of, all_results)
+    
+    def _wait_for_batch(self, model: str, batch_id: str, retrieve, is_done):
+        """Poll a batch job until is_done(job) holds; returns the final job object."""
+        while True:
+            job = retrieve(batch_id)
+            if is_done(job):
+                return job
+            logger.info(f"{model} batch {batch_id}: {getattr(job, 'status', None) or getattr(job, 'processing_status', None)}")
+            time.sleep(BATCH_POLL_SECONDS)
+    
+    def _submit_openai_batch(self, pending: List[tuple]) -> str:
+        """Upload one /v1/responses request per chunk and start an OpenAI batch."""
+        client = self.clients['openai']
+        lines = [
+            orjson.dumps({
+                'custom_id': chunk_id,
+                'method': 'POST',
+                'url': '/v1/responses',
+                'body': {
+                    'model': OPENAI_MODEL,
+                    'input': self._create_prompt(greek_text),
+                    'reasoning': {'effort': OPENAI_REASONING_EFFORT},
+                    'text': {'verbosity': OPENAI_VERBOSITY},
+                    'max_output_tokens': OPENAI_MAX_OUTPUT_TOKENS,
+                },
+            })
+            for chunk_id, greek_text in pending
+        ]
+        batch_file = client.files.create(file=('translations.jsonl', b'\n'.join(lines)), purpose='batch')
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint='/v1/responses',
+            completion_window='24h'
+        )
+        logger.info(f"OpenAI batch submitted: {batch.id} ({len(lines)} requests)")
+        return batch.id
+    
+    def _collect_openai_batch(self, batch_id: str) -> Dict[str, Translation]:
+        """Wait for an OpenAI batch and turn its output file into Translations."""
+        client = self.clients['openai']
+        batch = self._wait_for_batch(
+            'openai', batch_id, client.batches.retrieve,
+            lambda job: job.status in ('completed', 'failed', 'expired', 'cancelled')
+        )
+        if batch.status != 'completed':
+            logger.error(f"OpenAI batch {batch_id} ended with status {batch.status}")
+        
+        results = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = orjson.loads(line)
+                chunk_id = record['custom_id']
+                response = record.get('response') or {}
+                body = response.get('body') or {}
+                
+                raw_response = ''.join(
+                    part.get('text', '')
+                    for item in body.get('output') or [] if item.get('type') == 'message'
+                    for part in item.get('content') or [] if part.get('type') == 'output_text'
+                ).strip()
+                usage = body.get('usage') or {}
+                metadata = {
+                    'model': 'gpt-5',
+                    'reasoning_effort': 'high',
+                    'batch_id': batch_id,
+                    'response_id': body.get('id'),
+                    'input_tokens': usage.get('input_tokens'),
+                    'output_tokens': usage.get('output_tokens'),
+                }
+                
+                if response.get('status_code') == 200 and raw_response:
+                    results[chunk_id] = Translation(
+                        chunk_id=chunk_id,
+                        model_name='openai',
+                        translation=self.extract_translation(raw_response),
+                        raw_response=raw_response,
+                        timestamp=datetime.now().isoformat(),
+                        status='success',
+                        metadata=metadata
+                    )
+                else:
+                    error = record.get('error') or body.get('error') or 'Empty response returned'
+                    results[chunk_id] = Translation(
+                        chunk_id=chunk_id,
+                        model_name='openai',
+                        translation='',
+                        raw_response=raw_response,
+                        timestamp=datetime.now().isoformat(),
+                        status='error',
+                        error_message=str(error),
+                        metadata=metadata
+                    )
+        return results
+    
+    def _submit_claude_batch(self, pending: List[tuple]) -> str:
+        """Start an Anthropic Message Batch with one request per chunk."""
+        batch = self.clients['claude'].messages.batches.create(
+            requests=[
+                {
+                    'custom_id': chunk_id,
+                    'params': {
+                        'model': CLAUDE_MODEL,
+                        'max_tokens': claude_max_tokens(greek_text),
+                        'temperature': CLAUDE_TEMPERATURE,
+                        'messages': [{'role': 'user', 'content': self._create_prompt(greek_text)}],
+                    },
+                }
+                for chunk_id, greek_text in pending
+            ]
+        )
+        logger.info(f"Claude batch submitted: {batch.id} ({len(pending)} requests)")
+        return batch.id
+    
+    def _collect_claude_batch(self, batch_id: str) -> Dict[str, Translation]:
+        """Wait for an Anthropic Message Batch and turn its results into Translations."""
+        batches = self.clients['claude'].messages.batches
+        self._wait_for_batch(
+            'claude', batch_id, batches.retrieve,
+            lambda job: job.processing_status == 'ended'
+        )
+        
+        results = {}
+        for entry in batches.results(batch_id):
+            chunk_id = entry.custom_id
+            metadata = {
+                'model': CLAUDE_MODEL,
+                'batch_id': batch_id,
+            }
+            
+            if entry.result.type == 'succeeded':
+                message = entry.result.message
+                raw_response = message.content[0].text.strip() if message.content else ''
+                metadata['tokens'] = message.usage.input_tokens + message.usage.output_tokens
+                if not raw_response:
+                    raw_response = "ERROR: Empty response returned"
+                    translation = raw_response
+                else:
+                    translation = self.extract_translation(raw_response)
+                results[chunk_id] = Translation(
+                    chunk_id=chunk_id,
+                    model_name='claude',
+                    translation=translation,
+                    raw_response=raw_response,
+                    timestamp=datetime.now().isoformat(),
+                    status='success' if not raw_response.startswith('ERROR:') else 'error',
+                    metadata=metadata
+                )
+            else:
+                error = getattr(entry.result, 'error', None) or entry.result.type
+                results[chunk_id] = Translation(
+                    chunk_id=chunk_id,
+                    model_name='claude',
+                    translation='',
+                    raw_response='',
+                    timestamp=datetime.now().isoformat(),
+                    status='error',
+                    error_message=str(error),
+                    metadata=metadata
+                )
+        return results
     
     def save_translations(self, translations: Dict[str, Dict[str, Translation]], output_file: str):
         """Save translations to JSON file."""
-        import json
-        
         # Convert to serializable format
         output_data = {}
         for chunk_id, model_translations in translations.items():
             output_data[chunk_id] = {}
             for model, translation in model_translations.items():
-                output_data[chunk_id][model] = {
-                    'translation': translation.translation,
-                    'raw_response': translation.raw_response,
-                    'status': translation.status,
-                    'timestamp': translation.timestamp,
-                    'error_message': translation.error_message,
-                    'metadata': translation.metadata
-                }
+                output_data[chunk_id][model] = _translation_record(translation)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        # orjson writes UTF-8 bytes; OPT_INDENT_2 output matches json.dump(indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
         
         logger.info(f"Translations saved to {output_file}")
 
 
+def summarize_translations(translations: Dict[str, Dict[str, Translation]]) -> Dict:
+    """
+    Tally translation outcomes in one pass over all (chunk, model) results.
+    
+    Returns:
+        Dict with 'chunks', 'attempts', 'successful' and 'by_model', mapping
+        each model to a Counter of its statuses
+    """
+    by_model = {}
+    for chunk_translations in translations.values():
+        for model, translation in chunk_translations.items():
+            by_model.setdefault(model, Counter())[translation.status] += 1
+    
+    return {
+        'chunks': len(translations),
+        'attempts': sum(sum(statuses.values()) for statuses in by_model.values()),
+        'successful': sum(statuses['success'] for statuses in by_model.values()),
+        'by_model': by_model
+    }
+
+
 def main():
     """Command-line interface for translator."""
     import argparse
-    import json
     from parser import InputParser
     
     parser = argparse.ArgumentParser(description="Translate Ancient Greek texts")
@@ -590,9 +1293,21 @@ def main():
     parser.add_argument('--models', nargs='+', choices=['openai', 'claude', 'gemini'],
                        default=['openai', 'claude', 'gemini'], help='Models to use')
     parser.add_argument('--parallel', action='store_true', help='Run models in parallel (faster)')
+    parser.add_argument('--chunk-workers', type=int, default=1,
+                       help='Chunks to translate concurrently (default: 1)')
+    parser.add_argument('--cache', default=None,
+                       help='Path of an SQLite cache of translations, reused across runs')
+    parser.add_argument('--checkpoint', default=None,
+                       help='Write each finished chunk to this JSONL file as the run progresses')
+    parser.add_argument('--resume', action='store_true',
+                       help='Keep the --checkpoint file and skip chunks already translated in it')
+    parser.add_argument('--batch-api', action='store_true',
+                       help='Use the OpenAI/Anthropic Batch APIs (cheaper, results can take hours)')
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
     
     args = parser.parse_args()
+    if args.resume and not args.checkpoint:
+        parser.error('--resume needs --checkpoint')
     
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -612,8 +1327,16 @@ def main():
     ]
     
     # Translate
-    translator = Translator(models=args.models)
-    translations = translator.translate_chunks(chunks, parallel=args.parallel)
+    translator = Translator(models=args.models, chunk_workers=args.chunk_workers, cache_path=args.cache)
+    try:
+        if args.batch_api:
+            translations = translator.translate_chunks_batch(chunks)
+        else:
+            translations = translator.translate_chunks(
+                chunks, parallel=args.parallel, checkpoint_file=args.checkpoint, resume=args.resume
+            )
+    finally:
+        translator.close()
     
     # Save
     if args.output:
@@ -625,16 +1348,11 @@ def main():
     translator.save_translations(translations, output_file)
     
     # Summary
-    total_chunks = len(translations)
-    successful = sum(
-        1 for chunk_translations in translations.values()
-        for translation in chunk_translations.values()
-        if translation.status == 'success'
-    )
-    total_attempts = sum(len(chunk_translations) for chunk_translations in translations.values())
+    summary = summarize_translations(translations)
+    successful, total_attempts = summary['successful'], summary['attempts']
     
     print(f"\n✓ Translation complete!")
-    print(f"  Chunks: {total_chunks}")
+    print(f"  Chunks: {summary['chunks']}")
     print(f"  Success rate: {successful}/{total_attempts} ({100*successful/total_attempts:.1f}%)")
     print(f"  Output: {output_file}")
     
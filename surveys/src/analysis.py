@@ -10,6 +10,7 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from scipy import stats
 from collections import defaultdict
+from itertools import combinations
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -54,6 +55,12 @@ def get_comparison_type(left, right):
     else:
         return 'human_vs_human'
 
+def count_outcomes(scores):
+    """Count (positive, negative, zero) scores with a single bincount pass"""
+    signs = np.sign(np.asarray(scores)).astype(np.intp) + 1
+    losses, ties, wins = np.bincount(signs, minlength=3)
+    return wins, losses, ties
+
 def normalize_preference(row):
     """
     Convert position-relative preference to source-centric preference.
@@ -209,32 +216,39 @@ print()
 print("SUMMARY STATISTICS BY AI MODEL")
 print("-" * 60)
 
+def preference_stats(scores):
+    """Summary stats and one-sample t-test (vs. 0) from a single float array"""
+    scores = np.asarray(scores, dtype=np.float64)
+    n = scores.size
+    mean_pref = scores.mean()
+    std_pref = scores.std(ddof=1)
+    human_wins, ai_wins, ties = count_outcomes(scores)
+    
+    # One-sample t-test against 0, reusing the mean and std computed above
+    t_stat = mean_pref / (std_pref / np.sqrt(n))
+    p_val = 2 * stats.t.sf(abs(t_stat), n - 1)
+    
+    return {'n': n, 'mean': mean_pref, 'std': std_pref, 'human_wins': human_wins,
+            'ai_wins': ai_wins, 'ties': ties, 't_stat': t_stat, 'p_val': p_val}
+
+model_pref_stats = {}
+
 for model in AI_MODELS:
     model_data = ai_human_df[ai_human_df['ai_model'] == model]
     
     # Human preference score (negative of AI preference)
-    human_scores = -model_data['ai_preference']
-    
-    n = len(model_data)
-    mean_pref = human_scores.mean()
-    std_pref = human_scores.std()
-    
-    # Win rates
-    human_wins = (human_scores > 0).sum()
-    ai_wins = (human_scores < 0).sum()
-    ties = (human_scores == 0).sum()
+    model_pref_stats[model] = ps = preference_stats(-model_data['ai_preference'].to_numpy())
+    n = ps['n']
+    human_wins, ai_wins, ties = ps['human_wins'], ps['ai_wins'], ps['ties']
     
     print(f"\n{MODEL_NAMES[model]}:")
     print(f"  N comparisons: {n}")
-    print(f"  Mean human preference: {mean_pref:.3f} (scale: -2 to +2)")
-    print(f"  Std: {std_pref:.3f}")
+    print(f"  Mean human preference: {ps['mean']:.3f} (scale: -2 to +2)")
+    print(f"  Std: {ps['std']:.3f}")
     print(f"  Human preferred: {human_wins} ({100*human_wins/n:.1f}%)")
     print(f"  AI preferred: {ai_wins} ({100*ai_wins/n:.1f}%)")
     print(f"  Neutral: {ties} ({100*ties/n:.1f}%)")
-    
-    # One-sample t-test against 0 (no preference)
-    t_stat, p_val = stats.ttest_1samp(human_scores, 0)
-    print(f"  One-sample t-test (vs. neutral): t={t_stat:.3f}, p={p_val:.4f}")
+    print(f"  One-sample t-test (vs. neutral): t={ps['t_stat']:.3f}, p={ps['p_val']:.4f}")
 
 # ============================================================================
 # CHART 1: Stacked Bar Chart - LLM vs Human Translation
@@ -326,9 +340,7 @@ def create_win_rate_chart(data, filename):
         human_scores = -model_data['ai_preference']
         
         n = len(model_data)
-        human_wins = (human_scores > 0).sum() / n * 100
-        ai_wins = (human_scores < 0).sum() / n * 100
-        ties = (human_scores == 0).sum() / n * 100
+        human_wins, ai_wins, ties = (c / n * 100 for c in count_outcomes(human_scores))
         
         win_rates.append({
             'model': MODEL_NAMES[model],
@@ -388,56 +400,50 @@ def compute_pairwise_stats(data):
     sources = AI_MODELS + HUMAN_TRANSLATORS
     results = {}
     
+    # Group every comparison by its (unordered) matchup once, rather than
+    # masking the whole frame for each candidate pair
+    left = data['Left Translation'].to_numpy()
+    right = data['Right Translation'].to_numpy()
+    scores = data['Preference Score'].to_numpy()
+    pair_lo = np.where(left < right, left, right)
+    pair_hi = np.where(left < right, right, left)
+    matchups = data.groupby([pair_lo, pair_hi], sort=False).indices
+    
     # For each pair, find comparisons where they faced each other
-    for i, s1 in enumerate(sources):
-        for s2 in sources[i+1:]:
-            # Find rows where these two faced off
-            mask = ((data['Left Translation'] == s1) & (data['Right Translation'] == s2)) | \
-                   ((data['Left Translation'] == s2) & (data['Right Translation'] == s1))
-            
-            comparisons = data[mask]
-            
-            if len(comparisons) == 0:
-                continue
-            
-            # Calculate wins for s1
-            s1_wins = 0
-            s2_wins = 0
-            ties = 0
-            
-            for _, row in comparisons.iterrows():
-                left = row['Left Translation']
-                right = row['Right Translation']
-                score = row['Preference Score']
-                left_pref = -score
-                right_pref = score
-                prefs = {left: left_pref, right: right_pref}
-                
-                if prefs[s1] > prefs[s2]:
-                    s1_wins += 1
-                elif prefs[s2] > prefs[s1]:
-                    s2_wins += 1
-                else:
-                    ties += 1
-            
-            n = len(comparisons)
-            
-            # Binomial test for significance
-            if s1_wins + s2_wins > 0:
-                # Test if s1's win rate differs from 50%
-                result = stats.binomtest(s1_wins, s1_wins + s2_wins, 0.5, alternative='two-sided')
-                p_value = result.pvalue
-            else:
-                p_value = 1.0
-            
-            results[(s1, s2)] = {
-                's1_wins': s1_wins,
-                's2_wins': s2_wins,
-                'ties': ties,
-                'n': n,
-                'p_value': p_value,
-                's1_rate': s1_wins / (s1_wins + s2_wins) if (s1_wins + s2_wins) > 0 else 0.5
-            }
+    for s1, s2 in combinations(sources, 2):
+        rows = matchups.get((min(s1, s2), max(s1, s2)))
+        
+        if rows is None:
+            continue
+        
+        # Preference for s1 straight from the stored scores: the score is
+        # negative when the left translation was preferred
+        s1_pref = np.where(left[rows] == s1, -scores[rows], scores[rows])
+        
+        # s1 beats s2 exactly when its preference is positive
+        s1_wins, s2_wins, ties = (int(c) for c in count_outcomes(s1_pref))
+        
+        n = len(rows)
+        
+        results[(s1, s2)] = {
+            's1_wins': s1_wins,
+            's2_wins': s2_wins,
+            'ties': ties,
+            'n': n,
+            's1_rate': s1_wins / (s1_wins + s2_wins) if (s1_wins + s2_wins) > 0 else 0.5
+        }
+    
+    # Two-sided binomial tests against 50% for every pair in one vectorized
+    # call; with p=0.5 the distribution is symmetric, so the p-value is twice
+    # the lower tail of the smaller win count
+    wins = np.array([[r['s1_wins'], r['s2_wins']] for r in results.values()]).reshape(-1, 2)
+    decided = wins.sum(axis=1)
+    p_values = np.minimum(1.0, 2 * stats.binom.cdf(wins.min(axis=1), decided, 0.5))
+    # No decisive comparisons means no evidence either way
+    p_values[decided == 0] = 1.0
+    
+    for r, p_value in zip(results.values(), p_values):
+        r['p_value'] = float(p_value)
     
     return results
 
@@ -732,15 +738,10 @@ When AI translations were directly compared with human translations:
 """
 
 for model in AI_MODELS:
-    model_data = ai_human_df[ai_human_df['ai_model'] == model]
-    human_scores = -model_data['ai_preference']
-    n = len(model_data)
-    mean_pref = human_scores.mean()
-    human_wins = (human_scores > 0).sum()
-    ai_wins = (human_scores < 0).sum()
-    ties = (human_scores == 0).sum()
-    
-    t_stat, p_val = stats.ttest_1samp(human_scores, 0)
+    ps = model_pref_stats[model]
+    n, mean_pref = ps['n'], ps['mean']
+    human_wins, ai_wins, ties = ps['human_wins'], ps['ai_wins'], ps['ties']
+    t_stat, p_val = ps['t_stat'], ps['p_val']
     
     report += f"""
 {MODEL_NAMES[model]}: